@@ -3,11 +3,14 @@ from config import Config
 from .extensions import db, migrate, bcrypt, cors, login_manager, session, mail
 from .models import User
 from .logging_config import LoggingConfig
+from .schemas import MsgspecJSONProvider
+from . import instrumentation, monitoring, profiling
 from itsdangerous import URLSafeTimedSerializer
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.json = MsgspecJSONProvider(app)
     LoggingConfig.setup(app)
     
     #EXTENTIONS
@@ -18,6 +21,9 @@ def create_app(config_class=Config):
     login_manager.init_app(app) 
     session.init_app(app) 
     mail.init_app(app)
+    instrumentation.init_app(app)
+    monitoring.init_app(app, db)
+    profiling.init_app(app)
     
     from . import extensions
     extensions.serializer = URLSafeTimedSerializer(app.config["SECRET_KEY"])
@@ -6,6 +6,8 @@ from .read import read_bp
 from .update import update_bp
 from .export import export_bp
 from .print import print_bp
+from .stream import stream_bp
+from .monitoring import monitoring_bp
 
 
 api_bp = Blueprint("api", __name__, url_prefix="/api")
@@ -18,3 +20,5 @@ api_bp.register_blueprint(read_bp, url_prefix="/read")
 api_bp.register_blueprint(update_bp, url_prefix="/update")
 api_bp.register_blueprint(export_bp, url_prefix="/export")
 api_bp.register_blueprint(print_bp, url_prefix="/print")
+api_bp.register_blueprint(stream_bp, url_prefix="/stream")
+api_bp.register_blueprint(monitoring_bp)
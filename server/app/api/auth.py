@@ -1,4 +1,5 @@
 from flask import Blueprint, jsonify, request, session, current_app
+from app import cache
 from app.extensions import db, bcrypt
 from app.models import User
 from flask_login import login_user, logout_user, current_user, login_required
@@ -54,6 +55,7 @@ def register():
         
         db.session.add(new_user)
         db.session.commit()
+        cache.invalidate("users")
         current_app.logger.info(f"[NEW REGISTRATION]: {new_user.first_name} has been added to the database")
         return jsonify(success=True, message=f"{new_user.first_name} has been registered!"), 200
     except Exception as e:
@@ -1,50 +1,74 @@
+from collections import Counter
+from datetime import date
+
 from flask import Blueprint, jsonify, request, current_app
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import joinedload
+from app import cache, pubsub
 from app.extensions import db
-from flask_login import current_user
-from app.models import Machine, MachineNote, WorkOrder, WorkOrderEvent
+from flask_login import current_user, login_required
+from app.models import Machine, MachineNote, MachineNoteToken, MachineSearchGram, WorkOrder, WorkOrderEvent
+from app.models.machine_note_tokens import token_rows
+from app.models.machine_search_grams import search_gram_rows
+from app.models.technician_daily_rollups import increment_rollups
 from app.models.enums import CategoryEnum, ConditionEnum, VendorEnum, StatusEnum, EventEnum, EventReasonEnum
 
 create_bp = Blueprint("create", __name__)
 
+MAX_BULK_MACHINES = 500
 
-@create_bp.post("/machine")
-def add_new_machine():
-    data = request.get_json()
-    if not data:
-        return jsonify(success=False, message="No data in payload"), 400
+
+def _parse_machine(data: dict) -> tuple[dict | None, str | None]:
+    # Returns (Machine column values, None) or (None, error message).
+    required = ["brand", "model", "form_factor", "color", "category", "condition", "vendor"]
+    not_text = [k for k in ("serial", *required, "note_content") if data.get(k) is not None and not isinstance(data[k], str)]
+    if not_text:
+        return None, f"Fields must be text: {', '.join(not_text)}"
     
     serial = (data.get("serial") or "").strip().upper()
     if not serial:
-        return jsonify(success=False, message="Serial number is required"), 400
+        return None, "Serial number is required"
     
-    required = ["brand", "model", "form_factor", "color", "category", "condition", "vendor"]
     missing = [k for k in required if not (data.get(k) or "").strip()]
     if missing:
-        return jsonify(success=False, message=f"Missing required fields: {",".join(missing)}"), 400
-    
-    existing = db.session.query(Machine).filter_by(serial=serial).first()
-    if existing:
-        return jsonify(success=False, message="Machine already exists in database."), 409
+        return None, f"Missing required fields: {",".join(missing)}"
     
     try:
         category = CategoryEnum((data.get("category") or "").strip().lower())
         condition = ConditionEnum((data.get("condition") or "").strip().lower())
         vendor = VendorEnum((data.get("vendor") or "").strip().lower())
     except (KeyError, ValueError):
-        return jsonify(success=False, message="Bad data in one or more [category, condition, vendor]"), 400
-    
-    new_machine = Machine(
-        brand=(data.get("brand") or "").strip().lower(),
-        model=(data.get("model") or "").strip().upper(),
-        serial=serial,
-        category=category,
-        form_factor=(data.get("form_factor") or "").strip().lower(),
-        color=(data.get("color") or "").strip().lower(),
-        condition=condition,
-        vendor=vendor
-    )
+        return None, "Bad data in one or more [category, condition, vendor]"
+    
+    return {
+        "brand": (data.get("brand") or "").strip().lower(),
+        "model": (data.get("model") or "").strip().upper(),
+        "serial": serial,
+        "category": category,
+        "form_factor": (data.get("form_factor") or "").strip().lower(),
+        "color": (data.get("color") or "").strip().lower(),
+        "condition": condition,
+        "vendor": vendor,
+    }, None
+
+
+@create_bp.post("/machine")
+def add_new_machine():
+    data = request.get_json()
+    if not data:
+        return jsonify(success=False, message="No data in payload"), 400
+    
+    fields, message = _parse_machine(data)
+    if message:
+        return jsonify(success=False, message=message), 400
+    
+    existing = db.session.query(Machine).filter_by(serial=fields["serial"]).first()
+    if existing:
+        return jsonify(success=False, message="Machine already exists in database."), 409
+    
+    new_machine = Machine(**fields)
     db.session.add(new_machine)
-    db.session.flush()
+    new_machine.reindex_search_grams()
     
     new_work_order = WorkOrder(
         machine_id=new_machine.id,
@@ -53,6 +77,7 @@ def add_new_machine():
     )
     db.session.add(new_work_order)
     db.session.flush()
+    new_machine.sync_latest_work_order(new_work_order)
     
     new_event = WorkOrderEvent(
         work_order_id=new_work_order.id,
@@ -71,9 +96,12 @@ def add_new_machine():
         machine_id=new_machine.id
     )
     db.session.add(new_note)
+    new_note.reindex_tokens()
     
     try:
         db.session.commit()
+        cache.invalidate("machines", "events", f"user:{current_user.id}")
+        pubsub.publish_status_change(new_event, new_machine)
         current_app.logger.info(f"[NEW MACHINE ADDED]: {current_user.first_name} {current_user.last_name} has added a new {new_machine.category}")
         return jsonify(
             success=True, 
@@ -86,6 +114,148 @@ def add_new_machine():
         return jsonify(success=False, message="There was an error when adding new machine"), 500
     
     
+@create_bp.post("/machines")
+@login_required
+def add_new_machines():
+    data = request.get_json(silent=True) or {}
+    items = data.get("machines")
+    if not isinstance(items, list) or not items:
+        return jsonify(success=False, message="machines must be a non-empty list"), 400
+    if len(items) > MAX_BULK_MACHINES:
+        return jsonify(success=False, message=f"A maximum of {MAX_BULK_MACHINES} machines can be added at once"), 400
+    
+    # Validate the whole batch before writing anything; the batch is all-or-nothing.
+    errors = []
+    parsed = []
+    first_index = {}
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors.append({"index": index, "serial": None, "message": "Each machine must be an object"})
+            continue
+        fields, message = _parse_machine(item)
+        if message:
+            serial = item.get("serial")
+            serial = serial.strip().upper() or None if isinstance(serial, str) else None
+            errors.append({"index": index, "serial": serial, "message": message})
+            continue
+        serial = fields["serial"]
+        if serial in first_index:
+            errors.append({"index": index, "serial": serial, "message": f"Duplicate of item {first_index[serial]} in this batch"})
+            continue
+        first_index[serial] = index
+        parsed.append((index, fields, item.get("note_content") or ""))
+    
+    serials = [fields["serial"] for _, fields, _ in parsed]
+    if serials:
+        existing = set(db.session.scalars(select(Machine.serial).where(Machine.serial.in_(serials))))
+        errors.extend(
+            {"index": index, "serial": fields["serial"], "message": "Machine already exists in database."}
+            for index, fields, _ in parsed
+            if fields["serial"] in existing
+        )
+    if errors:
+        errors.sort(key=lambda e: e["index"])
+        return jsonify(
+            success=False,
+            message=f"{len(errors)} of {len(items)} machines were rejected; nothing was added",
+            errors=errors
+        ), 400
+    
+    # Core multi-row inserts: one statement per table instead of a flush per row.
+    # They skip the ORM, so search grams, note tokens, the latest work order
+    # pointer and technician rollups are written explicitly below.
+    today = date.today()
+    try:
+        db.session.execute(
+            insert(Machine.__table__),
+            [{**fields, "current_status": StatusEnum.IN_PROGRESS} for _, fields, _ in parsed]
+        )
+        machine_ids = dict(db.session.execute(select(Machine.serial, Machine.id).where(Machine.serial.in_(serials))).all())
+        # Intake order, so work order ids follow the order the batch was scanned in.
+        new_ids = [machine_ids[serial] for serial in serials]
+        
+        db.session.execute(insert(MachineSearchGram.__table__), [
+            row for _, fields, _ in parsed for row in search_gram_rows(machine_ids[fields["serial"]], fields)
+        ])
+        
+        db.session.execute(insert(WorkOrder.__table__), [
+            {"machine_id": machine_id, "initiated_by": current_user.id, "current_status": StatusEnum.IN_PROGRESS}
+            for machine_id in new_ids
+        ])
+        work_order_ids = dict(
+            db.session.execute(
+                select(WorkOrder.machine_id, WorkOrder.id).where(WorkOrder.machine_id.in_(new_ids))
+            ).all()
+        )
+        machines = Machine.__table__
+        db.session.execute(
+            update(machines)
+            .where(machines.c.id.in_(new_ids))
+            .values(
+                latest_work_order_id=select(func.max(WorkOrder.id))
+                .where(WorkOrder.machine_id == machines.c.id)
+                .scalar_subquery()
+            )
+        )
+        
+        db.session.execute(insert(WorkOrderEvent.__table__), [
+            {
+                "work_order_id": work_order_ids[machine_id],
+                "machine_id": machine_id,
+                "event_type": EventEnum.INITIATED,
+                "from_status": None,
+                "to_status": StatusEnum.IN_PROGRESS,
+                "event_date": today,
+                "technician_id": current_user.id,
+                "reason": EventReasonEnum.DEFAULT,
+            }
+            for machine_id in new_ids
+        ])
+        increment_rollups(db.session.connection(), Counter(
+            (current_user.id, today, EventEnum.INITIATED, EventReasonEnum.DEFAULT, fields["category"])
+            for _, fields, _ in parsed
+        ))
+        
+        notes = {machine_ids[fields["serial"]]: content for _, fields, content in parsed}
+        db.session.execute(insert(MachineNote.__table__), [
+            {"content": content, "added_on": today, "technician_id": current_user.id, "machine_id": machine_id}
+            for machine_id, content in notes.items()
+        ])
+        note_ids = dict(
+            db.session.execute(
+                select(MachineNote.machine_id, MachineNote.id).where(MachineNote.machine_id.in_(new_ids))
+            ).all()
+        )
+        tokens = [
+            row for machine_id, content in notes.items() for row in token_rows(note_ids[machine_id], machine_id, content)
+        ]
+        if tokens:
+            db.session.execute(insert(MachineNoteToken.__table__), tokens)
+        
+        db.session.commit()
+        cache.invalidate("machines", "events", f"user:{current_user.id}")
+        
+        events = db.session.scalars(
+            select(WorkOrderEvent)
+            .options(joinedload(WorkOrderEvent.machine))
+            .where(WorkOrderEvent.machine_id.in_(new_ids))
+            .order_by(WorkOrderEvent.id)
+        ).all()
+        for new_event in events:
+            pubsub.publish_status_change(new_event, new_event.machine)
+        
+        current_app.logger.info(f"[NEW MACHINES ADDED]: {current_user.first_name} {current_user.last_name} has added {len(parsed)} machines")
+        return jsonify(
+            success=True,
+            message=f"{len(parsed)} machines added!",
+            machines=[{"index": index, "serial": fields["serial"], "machine_id": machine_ids[fields["serial"]]} for index, fields, _ in parsed]
+        ), 201
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"[NEW MACHINES ERROR]: {e}")
+        return jsonify(success=False, message="There was an error when adding machines"), 500
+    
+    
 @create_bp.post("/note/<int:machine_id>")
 def add_note_to_machine(machine_id):
     machine = db.session.get(Machine, machine_id)
@@ -101,11 +271,12 @@ def add_note_to_machine(machine_id):
         technician_id=current_user.id,
         machine_id=machine.id
     )
-    
     db.session.add(note)
     
     try:
+        note.reindex_tokens()
         db.session.commit()
+        cache.invalidate(f"machine:{machine.id}")
         current_app.logger.info(f"[NEW NOTE ADDED]: {current_user.first_name} {current_user.last_name} notated machine [{machine.id}]")
         return jsonify(success=True, message="Note has been added", note=note.serialize()), 201
     except Exception as e:
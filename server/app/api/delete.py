@@ -3,8 +3,10 @@ from datetime import date
 from flask import Blueprint, jsonify
 from flask_login import current_user, login_required
 
+from app import cache, pubsub
 from app.extensions import db
-from app.models import Machine, MachineNote, WorkOrder, WorkOrderEvent
+from app.models import Machine, MachineEdit, MachineNote, WorkOrder, WorkOrderEvent
+from app.models.machine_edits import EDIT_DELETED, EDIT_NOTE_DELETED, EDIT_WORK_ORDER_DELETED
 from app.models.enums import EventEnum, EventReasonEnum, StatusEnum
 
 delete_bp = Blueprint("delete", __name__)
@@ -17,8 +19,15 @@ def delete_note(note_id):
         return jsonify(success=False, message="Note not found"), 404
 
     db.session.delete(note)
+    db.session.add(MachineEdit(
+        machine_id=note.machine_id,
+        note_id=note.id,
+        action=EDIT_NOTE_DELETED,
+        edited_by=current_user.id,
+    ))
     try:
         db.session.commit()
+        cache.invalidate(f"machine:{note.machine_id}")
         return jsonify(success=True, message="Note deleted"), 200
     except Exception as e:
         db.session.rollback()
@@ -32,12 +41,7 @@ def archive_machine(machine_id):
     if not machine:
         return jsonify(success=False, message="Machine not found"), 404
 
-    work_order = (
-        db.session.query(WorkOrder)
-        .filter_by(machine_id=machine.id)
-        .order_by(WorkOrder.id.desc())
-        .first()
-    )
+    work_order = machine.latest_work_order
     if not work_order:
         return jsonify(success=False, message="Work order not found"), 404
 
@@ -47,6 +51,7 @@ def archive_machine(machine_id):
     previous_status = work_order.current_status
     work_order.current_status = StatusEnum.ARCHIVED
     work_order.archived_on = date.today()
+    machine.sync_latest_work_order(work_order)
 
     event = WorkOrderEvent(
         work_order_id=work_order.id,
@@ -61,6 +66,8 @@ def archive_machine(machine_id):
 
     try:
         db.session.commit()
+        cache.invalidate("machines", "events", f"machine:{machine.id}", f"user:{current_user.id}")
+        pubsub.publish_status_change(event, machine)
         return jsonify(success=True, message="Machine archived"), 200
     except Exception as e:
         db.session.rollback()
@@ -74,12 +81,7 @@ def unarchive_machine(machine_id):
     if not machine:
         return jsonify(success=False, message="Machine not found"), 404
 
-    work_order = (
-        db.session.query(WorkOrder)
-        .filter_by(machine_id=machine.id)
-        .order_by(WorkOrder.id.desc())
-        .first()
-    )
+    work_order = machine.latest_work_order
     if not work_order:
         return jsonify(success=False, message="Work order not found"), 404
 
@@ -88,6 +90,7 @@ def unarchive_machine(machine_id):
 
     work_order.current_status = StatusEnum.IN_PROGRESS
     work_order.archived_on = None
+    machine.sync_latest_work_order(work_order)
 
     event = WorkOrderEvent(
         work_order_id=work_order.id,
@@ -102,6 +105,8 @@ def unarchive_machine(machine_id):
 
     try:
         db.session.commit()
+        cache.invalidate("machines", "events", f"machine:{machine.id}", f"user:{current_user.id}")
+        pubsub.publish_status_change(event, machine)
         return jsonify(success=True, message="Machine unarchived"), 200
     except Exception as e:
         db.session.rollback()
@@ -115,9 +120,19 @@ def delete_work_order(work_order_id):
     if not work_order:
         return jsonify(success=False, message="Work order not found"), 404
 
+    machine = work_order.machine
     db.session.delete(work_order)
+    if machine.latest_work_order_id == work_order.id:
+        machine.refresh_latest_work_order()
+    db.session.add(MachineEdit(
+        machine_id=machine.id,
+        work_order_id=work_order.id,
+        action=EDIT_WORK_ORDER_DELETED,
+        edited_by=current_user.id,
+    ))
     try:
         db.session.commit()
+        cache.invalidate("machines", f"machine:{machine.id}", "metrics")
         return jsonify(success=True, message="Work order deleted"), 200
     except Exception as e:
         db.session.rollback()
@@ -132,8 +147,10 @@ def delete_machine(machine_id):
         return jsonify(success=False, message="Machine not found"), 404
 
     db.session.delete(machine)
+    db.session.add(MachineEdit(machine_id=machine_id, action=EDIT_DELETED, edited_by=current_user.id))
     try:
         db.session.commit()
+        cache.invalidate("machines", f"machine:{machine_id}", "metrics")
         return jsonify(success=True, message="Machine deleted"), 200
     except Exception as e:
         db.session.rollback()
@@ -1,6 +1,8 @@
 from flask import jsonify, current_app, Blueprint, request, Response, render_template
 from app.extensions import db
-from app.models import Machine, User, WorkOrderEvent
+from app.models import Machine, TechnicianDailyRollup, User, WorkOrderEvent
+from app.models.enums import EventEnum
+from sqlalchemy import func
 from flask_login import login_required, current_user
 from io import StringIO
 from datetime import datetime
@@ -13,8 +15,34 @@ import os
 export_bp = Blueprint("export", __name__)
 
 
-def build_user_report(user_id, start_date, end_date):
+def build_user_report_summary(user_id, start_date, end_date):
+    rows = (
+        db.session.query(TechnicianDailyRollup.event_type, func.sum(TechnicianDailyRollup.event_count))
+        .filter(
+            TechnicianDailyRollup.technician_id == user_id,
+            TechnicianDailyRollup.event_date >= start_date,
+            TechnicianDailyRollup.event_date <= end_date,
+        )
+        .group_by(TechnicianDailyRollup.event_type)
+        .all()
+    )
+    counts = {e.value: 0 for e in EventEnum}
+    for event_type, count in rows:
+        counts[event_type.value] = int(count or 0)
+    return {"counts": counts, "total": sum(counts.values())}
+
+
+def build_user_report(user_id, start_date, end_date, summary_only=False, include_summary=True):
     user = db.session.get(User, user_id)
+    report_user = {
+        "id": user.id if user else user_id,
+        "name": f"{user.first_name} {user.last_name}" if user else str(user_id),
+    }
+    # CSV output has no summary section; skip the rollup query for it.
+    summary = build_user_report_summary(user_id, start_date, end_date) if summary_only or include_summary else None
+    if summary_only:
+        return {"user": report_user, "summary": summary, "rows": []}
+
     events = (
         db.session.query(WorkOrderEvent)
         .join(Machine, Machine.id == WorkOrderEvent.machine_id)
@@ -41,10 +69,8 @@ def build_user_report(user_id, start_date, end_date):
         )
 
     return {
-        "user": {
-            "id": user.id if user else user_id,
-            "name": f"{user.first_name} {user.last_name}" if user else str(user_id),
-        },
+        "user": report_user,
+        "summary": summary,
         "rows": rows,
     }
 
@@ -130,7 +156,11 @@ def export_user_report(id):
     except (ValueError, TypeError):
         return jsonify(success=False, message="Invalid date format, use YYYY-MM-DD"), 400
     
-    report = build_user_report(id, start_date, end_date)
+    if fmt == "summary":
+        report = build_user_report(id, start_date, end_date, summary_only=True)
+        return jsonify(success=True, user=report["user"], summary=report["summary"]), 200
+    
+    report = build_user_report(id, start_date, end_date, include_summary=fmt == "pdf")
     
     if not report["rows"]:
         return jsonify(success=False, message="No records in date range"), 404
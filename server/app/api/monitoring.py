@@ -0,0 +1,21 @@
+from flask import Blueprint, current_app, jsonify
+from flask_login import current_user, login_required
+
+from app import monitoring
+from app.models import RoleEnum
+
+monitoring_bp = Blueprint("monitoring", __name__)
+
+
+@monitoring_bp.get("/metrics")
+@login_required
+def prometheus_metrics():
+    if current_user.role != RoleEnum.ADMIN:
+        return jsonify(success=False, message="Admin access required"), 403
+
+    try:
+        body, content_type = monitoring.render()
+        return current_app.response_class(body, status=200, content_type=content_type)
+    except Exception as e:
+        current_app.logger.error(f"[METRICS EXPORT ERROR]: {e}")
+        return jsonify(success=False, message="Failed to render metrics"), 500
@@ -1,16 +1,78 @@
+import base64
+import binascii
+import time
 from datetime import date
+from enum import Enum
 
+import numpy as np
 from flask import Blueprint, current_app, jsonify, request
 from flask_login import current_user, login_required
-from sqlalchemy import func, select, case
-from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, func, literal, or_, select, union_all
+from sqlalchemy.orm import joinedload, selectinload
 
+from app import cache
 from app.extensions import db
-from app.models import Machine, User, WorkOrder, WorkOrderEvent
+from app.models import (
+    Machine,
+    MachineEdit,
+    MachineNote,
+    MachineNoteToken,
+    MachineSearchGram,
+    RoleEnum,
+    TechnicianDailyRollup,
+    User,
+    WorkOrder,
+    WorkOrderEvent,
+)
+from app.models.machine_edits import EDIT_DELETED, EDIT_NOTE_DELETED, EDIT_WORK_ORDER_DELETED
+from app.models.machine_note_tokens import tokenize
+from app.models.machine_search_grams import END_MARKER, SEARCH_FIELDS, START_MARKER, grams_for_term
 from app.models.enums import EventEnum, StatusEnum
+from app.schemas import (
+    MachineNoteSchema,
+    MachineSchema,
+    UserSchema,
+    WorkOrderEventSchema,
+    WorkOrderSchema,
+    encode_response,
+)
 
 read_bp = Blueprint("read", __name__)
 
+MAX_BATCH_SERIALS = 1000
+
+# ?fields= sparse fieldsets select only these columns, skipping ORM hydration.
+USER_FIELD_COLUMNS = {
+    "id": User.id,
+    "first_name": User.first_name,
+    "last_name": User.last_name,
+    "email": User.email,
+    "role": User.role,
+}
+MACHINE_FIELD_COLUMNS = {
+    "id": Machine.id,
+    "brand": Machine.brand,
+    "model": Machine.model,
+    "serial": Machine.serial,
+    "category": Machine.category,
+    "form_factor": Machine.form_factor,
+    "color": Machine.color,
+    "condition": Machine.condition,
+    "vendor": Machine.vendor,
+    "current_status": Machine.current_status,
+    "latest_work_order_id": Machine.latest_work_order_id,
+    "initiated_on": WorkOrder.initiated_on,
+    "initiated_by": WorkOrder.initiated_by,
+    "closed_on": WorkOrder.closed_on,
+    "archived_on": WorkOrder.archived_on,
+}
+NO_FACET_VALUE = "none"
+MAX_FRAGMENT_RESULTS = 100
+SNIPPET_RADIUS = 60
+DEFAULT_EVENTS_PER_PAGE = 100
+MAX_EVENTS_PER_PAGE = 500
+MAX_CHANGES_PER_STREAM = 500
+
 
 def _parse_iso_date(value: str | None):
     if not value:
@@ -21,10 +83,118 @@ def _parse_iso_date(value: str | None):
         return None
 
 
+def _encode_cursor(work_order_id: int | None, machine_id: int) -> str:
+    raw = f"{work_order_id if work_order_id is not None else ''}:{machine_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(value: str):
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        work_order_raw, machine_raw = raw.split(":")
+        work_order_id = int(work_order_raw) if work_order_raw else None
+        return work_order_id, int(machine_raw)
+    except (ValueError, UnicodeError, binascii.Error):
+        return None
+
+
+def _encode_change_token(watermarks: tuple, ceilings: tuple, observed_at: float) -> str:
+    raw = ":".join(str(part) for part in (*watermarks, *ceilings, int(observed_at * 1000)))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_change_token(value: str):
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        parts = [int(part) for part in raw.split(":")]
+        if len(parts) != 7:
+            return None
+        return tuple(parts[:3]), tuple(parts[3:6]), parts[6] / 1000
+    except (ValueError, UnicodeError, binascii.Error):
+        return None
+
+
+def _not_modified(etag: str | None):
+    if etag is None or not request.if_none_match.contains_weak(etag):
+        return None
+    response = current_app.response_class(status=304)
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _with_etag(response, etag: str | None):
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+        response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _list_etag(tags: list[str]) -> str | None:
+    return cache.weak_etag(tags, request.path, sorted(request.args.items(multi=True)))
+
+
+def _parse_event_filters(model=WorkOrderEvent):
+    start_date_raw = request.args.get("start_date")
+    end_date_raw = request.args.get("end_date")
+    event_types = [evt.strip().lower() for evt in request.args.getlist("event_type") if evt and evt.strip()]
+
+    start_date = _parse_iso_date(start_date_raw)
+    end_date = _parse_iso_date(end_date_raw)
+
+    if start_date_raw and not start_date:
+        return None, "Invalid start_date format. Use YYYY-MM-DD."
+    if end_date_raw and not end_date:
+        return None, "Invalid end_date format. Use YYYY-MM-DD."
+    if start_date and end_date and start_date > end_date:
+        return None, "start_date cannot be after end_date"
+
+    filters = []
+    if start_date:
+        filters.append(model.event_date >= start_date)
+    if end_date:
+        filters.append(model.event_date <= end_date)
+
+    parsed_event_types = []
+    for event_type in event_types:
+        try:
+            parsed_event_types.append(EventEnum(event_type))
+        except ValueError:
+            return None, f"Invalid event_type filter: {event_type}"
+    if parsed_event_types:
+        filters.append(model.event_type.in_(parsed_event_types))
+
+    return filters, None
+
+
+def _parse_fields(allowed: dict):
+    raw = (request.args.get("fields") or "").strip()
+    if not raw:
+        return None, None
+    fields = list(dict.fromkeys(f.strip().lower() for f in raw.split(",") if f.strip()))
+    unknown = [f for f in fields if f not in allowed]
+    if unknown:
+        return None, f"Unknown fields: {', '.join(unknown)}"
+    return fields, None
+
+
+def _serialize_value(value):
+    if isinstance(value, Enum):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _serialize_fields(row, fields: list[str]) -> dict:
+    mapping = row._mapping
+    return {f: _serialize_value(mapping[f]) for f in fields}
+
+
 def _build_machine_payload(machine: Machine, latest_work_order: WorkOrder | None, include_machine_notes: bool = False):
-    payload = machine.serialize(include_notes=include_machine_notes)
-    payload["latest_work_order"] = latest_work_order.serialize() if latest_work_order else None
-    return payload
+    return MachineSchema.from_model(machine, latest_work_order, include_notes=include_machine_notes)
 
 
 # --------------------
@@ -43,10 +213,25 @@ def get_user(id):
 
 
 @read_bp.get("/users")
+@cache.cached_response(["users"])
 def get_users():
     try:
-        users = db.session.query(User).order_by(User.first_name.asc(), User.last_name.asc()).all()
-        return jsonify(success=True, users=[u.serialize() for u in users]), 200
+        etag = _list_etag(["users"])
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+
+        fields, error = _parse_fields(USER_FIELD_COLUMNS)
+        if error:
+            return jsonify(success=False, message=error), 400
+
+        query = db.session.query(User).order_by(User.first_name.asc(), User.last_name.asc())
+        if fields:
+            rows = query.with_entities(*[USER_FIELD_COLUMNS[f].label(f) for f in fields]).all()
+            users = [_serialize_fields(row, fields) for row in rows]
+        else:
+            users = [UserSchema.from_model(u) for u in query.all()]
+        return _with_etag(jsonify(success=True, users=users), etag), 200
     except Exception as e:
         current_app.logger.error(f"[USER QUERY ERROR]: {e}")
         return jsonify(success=False, message="Something went wrong when querying for users"), 500
@@ -56,28 +241,115 @@ def get_users():
 #    MACHINE QUERY
 # --------------------
 @read_bp.get("/machine/<int:id>")
+@cache.cached_response(lambda id: [f"machine:{id}", "users"])
 def get_machine(id):
     try:
+        # Status changes, new notes, field edits and note/work order deletes all move
+        # one of these markers, so the ETag holds up without Redis. Only user renames
+        # (note authors are embedded) need the "users" tag, mixed in when readable.
+        markers = db.session.execute(
+            select(
+                select(func.max(WorkOrderEvent.id)).where(WorkOrderEvent.machine_id == id).scalar_subquery(),
+                select(func.max(MachineNote.id)).where(MachineNote.machine_id == id).scalar_subquery(),
+                select(func.max(MachineEdit.id)).where(MachineEdit.machine_id == id).scalar_subquery(),
+            )
+        ).one()
+        etag = cache.weak_etag([f"machine:{id}", "users"], id, *markers, tags_optional=True)
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+
+        # Fixed query count regardless of history: machine + latest work order +
+        # initiator in one joined query, then every note with its author in one selectin.
         machine = (
             db.session.query(Machine)
-            .options(joinedload(Machine.work_orders))
+            .options(
+                joinedload(Machine.latest_work_order).joinedload(WorkOrder.initiator),
+                selectinload(Machine.notes).joinedload(MachineNote.technician),
+            )
             .filter(Machine.id == id)
             .first()
         )
         if not machine:
             return jsonify(success=False, message=f"Machine with id {id} not found"), 404
 
-        latest_work_order = None
-        if machine.work_orders:
-            latest_work_order = max(machine.work_orders, key=lambda wo: wo.id)
-
-        return jsonify(success=True, machine=_build_machine_payload(machine, latest_work_order, include_machine_notes=True)), 200
+        return _with_etag(
+            jsonify(success=True, machine=_build_machine_payload(machine, machine.latest_work_order, include_machine_notes=True)),
+            etag,
+        ), 200
     except Exception as e:
         current_app.logger.error(f"[MACHINE QUERY ERROR]: {e}")
         return jsonify(success=False, message=f"Something went wrong when querying for machine with id {id}"), 500
 
 
+@read_bp.get("/machine/<int:id>/history")
+@cache.cached_response(lambda id: [f"machine:{id}", "users"])
+def get_machine_history(id):
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = min(max(request.args.get("per_page", 25, type=int), 1), 100)
+
+    try:
+        machine = db.session.get(Machine, id)
+        if not machine:
+            return jsonify(success=False, message=f"Machine with id {id} not found"), 404
+
+        # The timeline is ordered and paged in SQL over (date, kind, id) from the
+        # three machine_id indexes, then only that page's rows are loaded, so a page
+        # costs the same however many times the machine was reopened.
+        timeline = union_all(
+            select(WorkOrder.initiated_on.label("date"), literal(0).label("kind"), WorkOrder.id.label("id"))
+            .where(WorkOrder.machine_id == id),
+            select(WorkOrderEvent.event_date, literal(1), WorkOrderEvent.id)
+            .where(WorkOrderEvent.machine_id == id),
+            select(MachineNote.added_on, literal(2), MachineNote.id)
+            .where(MachineNote.machine_id == id),
+        ).subquery()
+        total_items = db.session.execute(select(func.count()).select_from(timeline)).scalar_one()
+        page_rows = db.session.execute(
+            select(timeline.c.kind, timeline.c.id)
+            .order_by(timeline.c.date.asc(), timeline.c.kind.asc(), timeline.c.id.asc())
+            .limit(per_page)
+            .offset((page - 1) * per_page)
+        ).all()
+
+        def load(model, relationship, kind):
+            ids = [row_id for row_kind, row_id in page_rows if row_kind == kind]
+            if not ids:
+                return {}
+            return {row.id: row for row in db.session.query(model).options(joinedload(relationship)).filter(model.id.in_(ids))}
+
+        work_orders = load(WorkOrder, WorkOrder.initiator, 0)
+        events = load(WorkOrderEvent, WorkOrderEvent.technician, 1)
+        notes = load(MachineNote, MachineNote.technician, 2)
+
+        def technician_name(user):
+            return f"{user.first_name} {user.last_name}" if user else None
+
+        def entry(kind, row_id):
+            if kind == 0:
+                wo = work_orders[row_id]
+                return {"type": "work_order", "date": wo.initiated_on.isoformat(), "work_order": wo.serialize()}
+            if kind == 1:
+                e = events[row_id]
+                return {"type": "event", "date": e.event_date.isoformat(), "event": {**e.serialize(), "technician": technician_name(e.technician)}}
+            n = notes[row_id]
+            return {"type": "note", "date": n.added_on.isoformat(), "note": {**n.serialize(), "technician": technician_name(n.technician)}}
+
+        return jsonify(
+            success=True,
+            machine=machine.serialize(),
+            timeline=[entry(kind, row_id) for kind, row_id in page_rows],
+            page=page,
+            total_pages=(total_items + per_page - 1) // per_page,
+            total_items=total_items,
+        ), 200
+    except Exception as e:
+        current_app.logger.error(f"[MACHINE HISTORY ERROR]: {e}")
+        return jsonify(success=False, message=f"Something went wrong when querying history for machine with id {id}"), 500
+
+
 @read_bp.get("/machines")
+@cache.cached_response(["machines", "users"])
 def get_machines():
     try:
         user_id = request.args.get("user_id", type=int)
@@ -85,21 +357,20 @@ def get_machines():
         page = request.args.get("page", 1, type=int)
         per_page = request.args.get("per_page", 8, type=int)
 
-        latest_work_order_id = (
-            select(func.max(WorkOrder.id))
-            .where(WorkOrder.machine_id == Machine.id)
-            .correlate(Machine)
-            .scalar_subquery()
-        )
+        etag = _list_etag(["machines", "users"])
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+
+        fields, error = _parse_fields(MACHINE_FIELD_COLUMNS)
+        if error:
+            return jsonify(success=False, message=error), 400
 
+        # MySQL sorts NULLs last on DESC, so machines without a work order still land at the end.
         query = (
             db.session.query(Machine, WorkOrder)
-            .outerjoin(WorkOrder, WorkOrder.id == latest_work_order_id)
-            .order_by(
-                case((WorkOrder.id.is_(None), 1), else_=0),
-                WorkOrder.id.desc(),
-                Machine.id.desc(),
-            )
+            .outerjoin(WorkOrder, WorkOrder.id == Machine.latest_work_order_id)
+            .order_by(Machine.latest_work_order_id.desc(), Machine.id.desc())
         )
 
         if user_id:
@@ -110,23 +381,173 @@ def get_machines():
                 status = StatusEnum(status_raw)
             except ValueError:
                 return jsonify(success=False, message="Invalid status filter"), 400
-            query = query.filter(WorkOrder.current_status == status)
+            query = query.filter(Machine.current_status == status)
+
+        if fields:
+            query = query.with_entities(
+                *[MACHINE_FIELD_COLUMNS[f].label(f) for f in fields],
+                Machine.id.label("_machine_id"),
+                Machine.latest_work_order_id.label("_latest_work_order_id"),
+            )
+
+            def build_row(row):
+                return _serialize_fields(row, fields)
+
+            def cursor_of(row):
+                return row._latest_work_order_id, row._machine_id
+        else:
+            query = query.options(joinedload(WorkOrder.initiator))
+
+            def build_row(row):
+                return _build_machine_payload(*row)
+
+            def cursor_of(row):
+                return row[0].latest_work_order_id, row[0].id
+
+        # Cursor mode: seek past the last (work order id, machine id) seen instead of
+        # OFFSET scanning, and skip the COUNT(*) that paginate() runs on every page.
+        if "after" in request.args:
+            after_raw = (request.args.get("after") or "").strip()
+            if after_raw:
+                cursor = _decode_cursor(after_raw)
+                if cursor is None:
+                    return jsonify(success=False, message="Invalid cursor"), 400
+                after_work_order_id, after_machine_id = cursor
+                if after_work_order_id is None:
+                    query = query.filter(Machine.latest_work_order_id.is_(None), Machine.id < after_machine_id)
+                else:
+                    query = query.filter(
+                        or_(
+                            Machine.latest_work_order_id.is_(None),
+                            Machine.latest_work_order_id < after_work_order_id,
+                            and_(Machine.latest_work_order_id == after_work_order_id, Machine.id < after_machine_id),
+                        )
+                    )
+
+            rows = query.limit(per_page + 1).all()
+            has_more = len(rows) > per_page
+            rows = rows[:per_page]
+
+            next_cursor = _encode_cursor(*cursor_of(rows[-1])) if has_more and rows else None
+
+            machines = [build_row(row) for row in rows]
+            return _with_etag(encode_response(success=True, machines=machines, next_cursor=next_cursor), etag)
 
         pagination = query.paginate(page=page, per_page=per_page, error_out=False)
-        rows = pagination.items
+        machines = [build_row(row) for row in pagination.items]
+
+        return _with_etag(
+            encode_response(
+                success=True,
+                machines=machines,
+                page=page,
+                total_pages=pagination.pages,
+                total_items=pagination.total,
+            ),
+            etag,
+        )
+    except Exception as e:
+        current_app.logger.error(f"[MACHINE QUERY ERROR]: {e}")
+        return jsonify(success=False, message="There was an error when querying for machines"), 500
+
+
+@read_bp.get("/machines/facets")
+def get_machine_facets():
+    try:
+        cache_key = cache.versioned_key("machine_facets", ["machines"])
+        facets = cache.get_json(cache_key)
+        if facets is None:
+            rows = (
+                db.session.query(
+                    Machine.current_status,
+                    Machine.category,
+                    Machine.vendor,
+                    Machine.condition,
+                    WorkOrder.initiated_by,
+                    func.count(Machine.id),
+                )
+                .outerjoin(WorkOrder, WorkOrder.id == Machine.latest_work_order_id)
+                .group_by(
+                    Machine.current_status,
+                    Machine.category,
+                    Machine.vendor,
+                    Machine.condition,
+                    WorkOrder.initiated_by,
+                )
+                .all()
+            )
+
+            # Machines without a work order have no status or technician; they are
+            # counted under NO_FACET_VALUE since JSON object keys must be strings.
+            facets = {"status": {}, "category": {}, "vendor": {}, "condition": {}, "technician": {}, "combinations": []}
+            for status, category, vendor, condition, technician_id, count in rows:
+                combination = {
+                    "status": str(status) if status else NO_FACET_VALUE,
+                    "category": str(category),
+                    "vendor": str(vendor),
+                    "condition": str(condition),
+                    "technician": str(technician_id) if technician_id else NO_FACET_VALUE,
+                }
+                for dimension, value in combination.items():
+                    facets[dimension][value] = facets[dimension].get(value, 0) + count
+                facets["combinations"].append({**combination, "count": count})
 
-        machines = [_build_machine_payload(machine, work_order) for machine, work_order in rows]
+            cache.set_json(cache_key, facets)
+
+        return jsonify(success=True, facets=facets), 200
+    except Exception as e:
+        current_app.logger.error(f"[MACHINE FACETS ERROR]: {e}")
+        return jsonify(success=False, message="There was an error when counting machine facets"), 500
 
+
+@read_bp.get("/machines/search")
+def fragment_search():
+    term = (request.args.get("q") or "").strip().upper()
+    match = (request.args.get("match") or "contains").strip().lower()
+    field = (request.args.get("field") or "any").strip().lower()
+    limit = min(max(request.args.get("limit", 25, type=int), 1), MAX_FRAGMENT_RESULTS)
+
+    if match not in {"contains", "prefix", "suffix"}:
+        return jsonify(success=False, message="match must be one of contains, prefix, suffix"), 400
+    if field not in {"any", *SEARCH_FIELDS}:
+        return jsonify(success=False, message="field must be one of any, serial, model"), 400
+
+    fields = list(SEARCH_FIELDS) if field == "any" else [field]
+    anchored = {"contains": term, "prefix": f"{START_MARKER}{term}", "suffix": f"{term}{END_MARKER}"}[match]
+    grams = grams_for_term(anchored)
+    if not term or not grams:
+        return jsonify(success=False, message="Search term is too short"), 400
+
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    pattern = {"contains": f"%{escaped}%", "prefix": f"{escaped}%", "suffix": f"%{escaped}"}[match]
+
+    try:
+        # Every gram of the term must hit the same (machine, field); the LIKE then only
+        # re-checks that small candidate set for exact order/adjacency.
+        candidates = (
+            select(MachineSearchGram.machine_id)
+            .where(MachineSearchGram.field.in_(fields), MachineSearchGram.gram.in_(grams))
+            .group_by(MachineSearchGram.machine_id, MachineSearchGram.field)
+            .having(func.count(func.distinct(MachineSearchGram.gram)) == len(grams))
+        )
+        machines = (
+            db.session.query(Machine)
+            .options(joinedload(Machine.latest_work_order).joinedload(WorkOrder.initiator))
+            .filter(
+                Machine.id.in_(candidates),
+                or_(*[getattr(Machine, f).like(pattern, escape="\\") for f in fields]),
+            )
+            .order_by(Machine.id.desc())
+            .limit(limit)
+            .all()
+        )
         return jsonify(
             success=True,
-            machines=machines,
-            page=page,
-            total_pages=pagination.pages,
-            total_items=pagination.total,
+            machines=[_build_machine_payload(m, m.latest_work_order) for m in machines],
         ), 200
     except Exception as e:
-        current_app.logger.error(f"[MACHINE QUERY ERROR]: {e}")
-        return jsonify(success=False, message="There was an error when querying for machines"), 500
+        current_app.logger.error(f"[FRAGMENT SEARCH ERROR]: {e}")
+        return jsonify(success=False, message="There was an error when searching for machines"), 500
 
 
 @read_bp.get("/serial/<serial>")
@@ -137,12 +558,7 @@ def serial_search(serial):
         if not machine:
             return jsonify(success=False, message="Machine not found."), 404
 
-        latest_work_order = (
-            db.session.query(WorkOrder)
-            .filter_by(machine_id=machine.id)
-            .order_by(WorkOrder.id.desc())
-            .first()
-        )
+        latest_work_order = machine.latest_work_order
 
         if current_user.is_authenticated:
             current_app.logger.info(
@@ -155,10 +571,143 @@ def serial_search(serial):
         return jsonify(success=False, message="There was an error when searching for machine by serial number"), 500
 
 
+@read_bp.post("/serials")
+def batch_serial_search():
+    data = request.get_json(silent=True) or {}
+    raw_serials = data.get("serials")
+    if not isinstance(raw_serials, list) or not raw_serials:
+        return jsonify(success=False, message="serials must be a non-empty list"), 400
+    if len(raw_serials) > MAX_BATCH_SERIALS:
+        return jsonify(success=False, message=f"A maximum of {MAX_BATCH_SERIALS} serials can be looked up at once"), 400
+
+    # Same normalization as serial_search; dict.fromkeys dedupes while keeping scan order.
+    normalized_serials = [s for s in dict.fromkeys(str(raw or "").strip().upper() for raw in raw_serials) if s]
+    if not normalized_serials:
+        return jsonify(success=False, message="No valid serials in payload"), 400
+
+    try:
+        machines = db.session.query(Machine).filter(Machine.serial.in_(normalized_serials)).all()
+
+        latest_work_order_ids = [m.latest_work_order_id for m in machines if m.latest_work_order_id is not None]
+        work_orders_by_id = {}
+        if latest_work_order_ids:
+            work_orders_by_id = {
+                wo.id: wo
+                for wo in (
+                    db.session.query(WorkOrder)
+                    .options(joinedload(WorkOrder.initiator))
+                    .filter(WorkOrder.id.in_(latest_work_order_ids))
+                    .all()
+                )
+            }
+
+        found = {
+            m.serial: _build_machine_payload(m, work_orders_by_id.get(m.latest_work_order_id))
+            for m in machines
+        }
+        missing = [serial for serial in normalized_serials if serial not in found]
+
+        if current_user.is_authenticated:
+            current_app.logger.info(
+                f"[MACHINE QUERY]: {current_user.first_name} {current_user.last_name} batch queried {len(normalized_serials)} serials"
+            )
+
+        return jsonify(success=True, found=found, missing=missing), 200
+    except Exception as e:
+        current_app.logger.error(f"[BATCH SERIAL SEARCH ERROR]: {e}")
+        return jsonify(success=False, message="There was an error when searching for machines by serial number"), 500
+
+
+# --------------------
+#    NOTE SEARCH
+# --------------------
+def _note_snippet(content: str, terms: list[str], radius: int = SNIPPET_RADIUS) -> str:
+    lowered = content.lower()
+    positions = [pos for pos in (lowered.find(term) for term in terms) if pos >= 0]
+    start = min(positions) if positions else 0
+    left = max(start - radius, 0)
+    right = min(start + radius, len(content))
+    return f"{'...' if left > 0 else ''}{content[left:right].strip()}{'...' if right < len(content) else ''}"
+
+
+@read_bp.get("/notes/search")
+def note_search():
+    terms = list(tokenize(request.args.get("q") or ""))
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = min(max(request.args.get("per_page", 8, type=int), 1), 100)
+
+    if not terms:
+        return jsonify(success=False, message="Search query is required"), 400
+
+    try:
+        # A machine matches when its notes, taken together, contain every term;
+        # rank by how often the terms appear across those notes.
+        ranked = (
+            select(
+                MachineNoteToken.machine_id,
+                func.sum(MachineNoteToken.frequency).label("score"),
+            )
+            .where(MachineNoteToken.token.in_(terms))
+            .group_by(MachineNoteToken.machine_id)
+            .having(func.count(func.distinct(MachineNoteToken.token)) == len(terms))
+        )
+        total_items = db.session.execute(select(func.count()).select_from(ranked.subquery())).scalar_one()
+        rows = db.session.execute(
+            ranked.order_by(func.sum(MachineNoteToken.frequency).desc(), MachineNoteToken.machine_id.desc())
+            .limit(per_page)
+            .offset((page - 1) * per_page)
+        ).all()
+
+        machine_ids = [row.machine_id for row in rows]
+        snippet_notes = {}
+        if machine_ids:
+            matching_notes = (
+                db.session.query(MachineNote)
+                .filter(
+                    MachineNote.id.in_(
+                        select(MachineNoteToken.note_id).where(
+                            MachineNoteToken.machine_id.in_(machine_ids),
+                            MachineNoteToken.token.in_(terms),
+                        )
+                    )
+                )
+                .order_by(MachineNote.id.desc())
+                .all()
+            )
+            for note in matching_notes:
+                snippet_notes.setdefault(note.machine_id, note)
+
+        results = []
+        for row in rows:
+            note = snippet_notes.get(row.machine_id)
+            results.append({
+                "machine_id": row.machine_id,
+                "score": int(row.score),
+                "note_id": note.id if note else None,
+                "snippet": _note_snippet(note.content, terms) if note else None,
+            })
+
+        return jsonify(
+            success=True,
+            results=results,
+            page=page,
+            total_pages=(total_items + per_page - 1) // per_page,
+            total_items=total_items,
+        ), 200
+    except Exception as e:
+        current_app.logger.error(f"[NOTE SEARCH ERROR]: {e}")
+        return jsonify(success=False, message="There was an error when searching machine notes"), 500
+
+
 # --------------------
 #    USER METRICS
 # --------------------
+# ?counts_only=1 returns just the per-type counts (from the daily rollup).
+# ?page / ?per_page (default 100, max 500) page the events list, newest first;
+# with neither set every event in range is returned, as the admin Metrics page
+# expects.
 @read_bp.get("/metrics/<int:id>")
+@cache.cached_response(lambda id: [f"user:{id}", "metrics"])
 def user_metrics(id):
     user = db.session.get(User, id)
     if not user:
@@ -166,47 +715,362 @@ def user_metrics(id):
 
     start_date_raw = request.args.get("start_date")
     end_date_raw = request.args.get("end_date")
-    event_types = [evt.strip().lower() for evt in request.args.getlist("event_type") if evt and evt.strip()]
-
-    start_date = _parse_iso_date(start_date_raw)
-    end_date = _parse_iso_date(end_date_raw)
-
-    if start_date_raw and not start_date:
-        return jsonify(success=False, message="Invalid start_date format. Use YYYY-MM-DD."), 400
-    if end_date_raw and not end_date:
-        return jsonify(success=False, message="Invalid end_date format. Use YYYY-MM-DD."), 400
-    if start_date and end_date and start_date > end_date:
-        return jsonify(success=False, message="start_date cannot be after end_date"), 400
-
-    query = db.session.query(WorkOrderEvent).filter(WorkOrderEvent.technician_id == user.id)
-
-    if start_date:
-        query = query.filter(WorkOrderEvent.event_date >= start_date)
-    if end_date:
-        query = query.filter(WorkOrderEvent.event_date <= end_date)
-
-    parsed_event_types = []
-    for event_type in event_types:
-        try:
-            parsed_event_types.append(EventEnum(event_type))
-        except ValueError:
-            return jsonify(success=False, message=f"Invalid event_type filter: {event_type}"), 400
+    counts_only = request.args.get("counts_only", "").strip().lower() in {"1", "true", "yes"}
+    paged = "page" in request.args or "per_page" in request.args
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = min(max(request.args.get("per_page", DEFAULT_EVENTS_PER_PAGE, type=int), 1), MAX_EVENTS_PER_PAGE)
 
-    if parsed_event_types:
-        query = query.filter(WorkOrderEvent.event_type.in_(parsed_event_types))
+    filters, error = _parse_event_filters()
+    if error:
+        return jsonify(success=False, message=error), 400
 
-    events = query.order_by(WorkOrderEvent.event_date.desc(), WorkOrderEvent.id.desc()).all()
+    filters.append(WorkOrderEvent.technician_id == user.id)
 
     counts = {e.value: 0 for e in EventEnum}
-    for event in events:
-        counts[event.event_type.value] += 1
+    if counts_only:
+        # Totals only: read the daily rollup instead of scanning raw events.
+        rollup_filters, _ = _parse_event_filters(TechnicianDailyRollup)
+        count_rows = (
+            db.session.query(TechnicianDailyRollup.event_type, func.sum(TechnicianDailyRollup.event_count))
+            .filter(TechnicianDailyRollup.technician_id == user.id, *rollup_filters)
+            .group_by(TechnicianDailyRollup.event_type)
+            .all()
+        )
+    else:
+        count_rows = (
+            db.session.query(WorkOrderEvent.event_type, func.count(WorkOrderEvent.id))
+            .filter(*filters)
+            .group_by(WorkOrderEvent.event_type)
+            .all()
+        )
+    for event_type, count in count_rows:
+        counts[event_type.value] = int(count or 0)
+    total_events = sum(counts.values())
 
     metrics = {
         "user": f"{user.first_name} {user.last_name}",
         "range": {"start_date": start_date_raw, "end_date": end_date_raw},
         "counts": counts,
-        "events": [e.serialize() for e in events],
+        "total_events": total_events,
     }
+
+    if not counts_only:
+        query = (
+            db.session.query(WorkOrderEvent)
+            .filter(*filters)
+            .order_by(WorkOrderEvent.event_date.desc(), WorkOrderEvent.id.desc())
+        )
+        if paged:
+            query = query.limit(per_page).offset((page - 1) * per_page)
+        metrics["events"] = [WorkOrderEventSchema.from_model(e) for e in query.all()]
+        if paged:
+            metrics["page"] = page
+            metrics["per_page"] = per_page
+            metrics["total_pages"] = (total_events + per_page - 1) // per_page
+
     return jsonify(success=True, metrics=metrics), 200
 
 
+@read_bp.get("/metrics")
+@cache.cached_response(["events", "metrics", "users"])
+def team_metrics():
+    start_date_raw = request.args.get("start_date")
+    end_date_raw = request.args.get("end_date")
+    bucket = (request.args.get("bucket") or "").strip().lower()
+    if bucket not in {"", "day"}:
+        return jsonify(success=False, message="bucket must be 'day' or omitted"), 400
+
+    filters, error = _parse_event_filters()
+    if error:
+        return jsonify(success=False, message=error), 400
+
+    try:
+        columns = [User.id, User.first_name, User.last_name, WorkOrderEvent.event_type]
+        if bucket == "day":
+            columns.append(WorkOrderEvent.event_date)
+
+        # Filters live in the join condition so technicians with no events in range
+        # still come back with zero counts.
+        rows = (
+            db.session.query(*columns, func.count(WorkOrderEvent.id))
+            .outerjoin(WorkOrderEvent, and_(WorkOrderEvent.technician_id == User.id, *filters))
+            .group_by(*columns)
+            .order_by(User.first_name.asc(), User.last_name.asc(), User.id.asc())
+            .all()
+        )
+
+        technicians = {}
+        for row in rows:
+            user_id, first_name, last_name, event_type = row[:4]
+            count = row[-1]
+            entry = technicians.setdefault(user_id, {
+                "id": user_id,
+                "user": f"{first_name} {last_name}",
+                "counts": {e.value: 0 for e in EventEnum},
+                "total_events": 0,
+            })
+            if event_type is None:
+                continue
+            entry["counts"][event_type.value] += count
+            entry["total_events"] += count
+            if bucket == "day":
+                day = entry.setdefault("days", {}).setdefault(
+                    row[4].isoformat(), {e.value: 0 for e in EventEnum}
+                )
+                day[event_type.value] += count
+
+        metrics = {
+            "range": {"start_date": start_date_raw, "end_date": end_date_raw},
+            "bucket": bucket or None,
+            "technicians": list(technicians.values()),
+        }
+        return jsonify(success=True, metrics=metrics), 200
+    except Exception as e:
+        current_app.logger.error(f"[TEAM METRICS ERROR]: {e}")
+        return jsonify(success=False, message="There was an error when querying team metrics"), 500
+
+
+# --------------------
+#    ANALYTICS
+# --------------------
+def _turnaround_groups(keys: np.ndarray, days: np.ndarray, reopens: np.ndarray) -> dict:
+    groups = {}
+    if keys.size == 0:
+        return groups
+
+    # Sort once by (key, days) so every group is a contiguous, already-sorted slice.
+    order = np.lexsort((days, keys))
+    keys, days, reopens = keys[order], days[order], reopens[order]
+    unique_keys, starts, sizes = np.unique(keys, return_index=True, return_counts=True)
+
+    for key, start, size in zip(unique_keys.tolist(), starts.tolist(), sizes.tolist()):
+        group_days = days[start:start + size]
+        p50, p90, p99 = np.percentile(group_days, [50, 90, 99])
+        groups[key] = {
+            "work_orders": size,
+            "p50_days": round(float(p50), 2),
+            "p90_days": round(float(p90), 2),
+            "p99_days": round(float(p99), 2),
+            "mean_days": round(float(group_days.mean()), 2),
+            "reopens": int(reopens[start:start + size].sum()),
+        }
+    return groups
+
+
+@read_bp.get("/analytics/turnaround")
+@cache.cached_response(["machines", "events", "metrics", "users"])
+def turnaround_analytics():
+    start_date = _parse_iso_date(request.args.get("start_date"))
+    end_date = _parse_iso_date(request.args.get("end_date"))
+    if request.args.get("start_date") and not start_date:
+        return jsonify(success=False, message="Invalid start_date format. Use YYYY-MM-DD."), 400
+    if request.args.get("end_date") and not end_date:
+        return jsonify(success=False, message="Invalid end_date format. Use YYYY-MM-DD."), 400
+
+    try:
+        filters = [WorkOrder.closed_on.is_not(None)]
+        if start_date:
+            filters.append(WorkOrder.closed_on >= start_date)
+        if end_date:
+            filters.append(WorkOrder.closed_on <= end_date)
+
+        reopen_counts = (
+            select(WorkOrderEvent.work_order_id, func.count(WorkOrderEvent.id).label("reopens"))
+            .where(WorkOrderEvent.event_type == EventEnum.REOPENED)
+            .group_by(WorkOrderEvent.work_order_id)
+            .subquery()
+        )
+        rows = db.session.execute(
+            select(
+                WorkOrder.initiated_by,
+                Machine.category,
+                WorkOrder.initiated_on,
+                WorkOrder.closed_on,
+                func.coalesce(reopen_counts.c.reopens, 0),
+            )
+            .join(Machine, Machine.id == WorkOrder.machine_id)
+            .outerjoin(reopen_counts, reopen_counts.c.work_order_id == WorkOrder.id)
+            .where(*filters)
+        ).all()
+
+        if rows:
+            technician_ids, categories, initiated_on, closed_on, reopens = zip(*rows)
+        else:
+            technician_ids, categories, initiated_on, closed_on, reopens = (), (), (), (), ()
+
+        days = (
+            np.array(closed_on, dtype="datetime64[D]") - np.array(initiated_on, dtype="datetime64[D]")
+        ).astype(np.int64)
+        reopens = np.array(reopens, dtype=np.int64)
+        technician_keys = np.array(technician_ids, dtype=np.int64)
+        category_keys = np.array([str(c) for c in categories], dtype=str)
+
+        names = {u.id: f"{u.first_name} {u.last_name}" for u in db.session.query(User.id, User.first_name, User.last_name)}
+        by_technician = [
+            {"technician_id": key, "user": names.get(key), **stats}
+            for key, stats in _turnaround_groups(technician_keys, days, reopens).items()
+        ]
+        by_category = [
+            {"category": key, **stats}
+            for key, stats in _turnaround_groups(category_keys, days, reopens).items()
+        ]
+        overall = _turnaround_groups(np.zeros(days.size, dtype=np.int64), days, reopens).get(0)
+
+        return jsonify(
+            success=True,
+            turnaround={
+                "range": {"start_date": request.args.get("start_date"), "end_date": request.args.get("end_date")},
+                "overall": overall,
+                "by_technician": by_technician,
+                "by_category": by_category,
+            },
+        ), 200
+    except Exception as e:
+        current_app.logger.error(f"[TURNAROUND ANALYTICS ERROR]: {e}")
+        return jsonify(success=False, message="There was an error when computing turnaround analytics"), 500
+
+
+# --------------------
+#    CHANGE FEED
+# --------------------
+# The token packs three watermarks: the last seen work order event id, machine
+# note id and machine edit id. Status changes, intake and archiving all append
+# events; field edits and machine, work order and note deletes append
+# machine_edits. Without ?since only the current token is returned so a client can
+# start from freshly loaded lists.
+#
+# Ids are assigned at insert but become visible at commit, so a row can appear
+# below an id a client has already passed. The token therefore also carries the
+# max ids seen at the previous poll (the ceiling) and when they were seen; a poll
+# only reads up to that ceiling once CHANGE_FEED_COMMIT_LAG_SECONDS have passed,
+# by which point every row under it has committed or rolled back. Changes show up
+# one poll later in exchange, and a transaction open longer than the lag can
+# still be missed.
+def _change_feed_maxima():
+    return tuple(
+        db.session.execute(
+            select(
+                select(func.coalesce(func.max(WorkOrderEvent.id), 0)).scalar_subquery(),
+                select(func.coalesce(func.max(MachineNote.id), 0)).scalar_subquery(),
+                select(func.coalesce(func.max(MachineEdit.id), 0)).scalar_subquery(),
+            )
+        ).one()
+    )
+
+
+@read_bp.get("/changes")
+def get_changes():
+    since_raw = request.args.get("since")
+    limit = min(max(request.args.get("limit", MAX_CHANGES_PER_STREAM, type=int), 1), MAX_CHANGES_PER_STREAM)
+    commit_lag = current_app.config.get("CHANGE_FEED_COMMIT_LAG_SECONDS", 2)
+
+    try:
+        now = time.time()
+        if not since_raw:
+            maxima = _change_feed_maxima()
+            return jsonify(
+                success=True,
+                token=_encode_change_token(maxima, maxima, now),
+                has_more=False,
+                machines=[],
+                work_orders=[],
+                events=[],
+                notes=[],
+                deleted_machine_ids=[],
+                deleted_work_order_ids=[],
+                deleted_note_ids=[],
+            ), 200
+
+        since = _decode_change_token(since_raw)
+        if since is None:
+            return jsonify(success=False, message="Invalid change token"), 400
+        watermarks, ceilings, observed_at = since
+        settled = now - observed_at >= commit_lag
+        # Until the ceiling has settled nothing new is read.
+        bounds = ceilings if settled else watermarks
+
+        def between(model, watermark, bound):
+            if bound <= watermark:
+                return []
+            return (
+                db.session.query(model)
+                .filter(model.id > watermark, model.id <= bound)
+                .order_by(model.id.asc())
+                .limit(limit + 1)
+                .all()
+            )
+
+        streams = [
+            between(model, watermark, bound)
+            for model, watermark, bound in zip((WorkOrderEvent, MachineNote, MachineEdit), watermarks, bounds)
+        ]
+
+        # Each stream is capped on its own; a capped stream only advances as far
+        # as what was returned, and the ceiling is kept until every stream has
+        # caught up to it so the next call picks up the remainder.
+        has_more = any(len(rows) > limit for rows in streams)
+        next_watermarks = tuple(
+            rows[limit - 1].id if len(rows) > limit else bound
+            for rows, bound in zip(streams, bounds)
+        )
+        events, notes, edits = (rows[:limit] for rows in streams)
+
+        if settled and not has_more:
+            token = _encode_change_token(next_watermarks, _change_feed_maxima(), now)
+        else:
+            token = _encode_change_token(next_watermarks, ceilings, observed_at)
+
+        deleted_machine_ids = sorted({edit.machine_id for edit in edits if edit.action == EDIT_DELETED})
+        deleted_work_order_ids = sorted(
+            {edit.work_order_id for edit in edits if edit.action == EDIT_WORK_ORDER_DELETED}
+        )
+        deleted_note_ids = sorted({edit.note_id for edit in edits if edit.action == EDIT_NOTE_DELETED})
+
+        machine_ids = (
+            {event.machine_id for event in events}
+            | {note.machine_id for note in notes}
+            | {edit.machine_id for edit in edits}
+        ) - set(deleted_machine_ids)
+        machines = (
+            db.session.query(Machine)
+            .filter(Machine.id.in_(machine_ids))
+            .order_by(Machine.id.asc())
+            .all()
+            if machine_ids else []
+        )
+
+        work_order_ids = {event.work_order_id for event in events} - set(deleted_work_order_ids)
+        work_orders = (
+            db.session.query(WorkOrder)
+            .filter(WorkOrder.id.in_(work_order_ids))
+            .order_by(WorkOrder.id.asc())
+            .all()
+            if work_order_ids else []
+        )
+
+        return jsonify(
+            success=True,
+            token=token,
+            has_more=has_more,
+            machines=[MachineSchema.from_model(machine) for machine in machines],
+            work_orders=[WorkOrderSchema.from_model(work_order) for work_order in work_orders],
+            events=[WorkOrderEventSchema.from_model(event) for event in events],
+            notes=[MachineNoteSchema.from_model(note) for note in notes],
+            deleted_machine_ids=deleted_machine_ids,
+            deleted_work_order_ids=deleted_work_order_ids,
+            deleted_note_ids=deleted_note_ids,
+        ), 200
+    except Exception as e:
+        current_app.logger.error(f"[CHANGE FEED ERROR]: {e}")
+        return jsonify(success=False, message="There was an error when reading the change feed"), 500
+
+
+# --------------------
+#    CACHE STATS
+# --------------------
+@read_bp.get("/cache/stats")
+@login_required
+def cache_stats():
+    if current_user.role != RoleEnum.ADMIN:
+        return jsonify(success=False, message="Admin access required"), 403
+    return jsonify(success=True, stats=cache.stats()), 200
@@ -0,0 +1,92 @@
+import json
+
+from flask import Blueprint, Response, current_app, jsonify, request
+from flask_login import login_required
+from sqlalchemy.orm import joinedload
+
+from app import pubsub
+from app.extensions import db
+from app.models import WorkOrderEvent
+
+stream_bp = Blueprint("stream", __name__)
+
+MAX_REPLAY_EVENTS = 500
+
+
+def _frame(message: dict) -> str:
+    lines = []
+    if message.get("id") is not None:
+        lines.append(f"id: {message['id']}")
+    lines.append(f"event: {message['type']}")
+    lines.append(f"data: {json.dumps(message['data'])}")
+    return "\n".join(lines) + "\n\n"
+
+
+def _replay_since(last_event_id: int) -> list[dict]:
+    events = (
+        db.session.query(WorkOrderEvent)
+        .options(joinedload(WorkOrderEvent.machine))
+        .filter(WorkOrderEvent.id > last_event_id)
+        .order_by(WorkOrderEvent.id.asc())
+        .limit(MAX_REPLAY_EVENTS)
+        .all()
+    )
+    return [
+        {"type": "status", "id": event.id, "data": pubsub.status_message(event, event.machine)}
+        for event in events
+    ]
+
+
+# --------------------
+#    STATUS STREAM
+# --------------------
+@stream_bp.get("/status")
+@login_required
+def status_stream():
+    raw_last_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    last_event_id = None
+    if raw_last_id:
+        try:
+            last_event_id = int(raw_last_id)
+        except ValueError:
+            return jsonify(success=False, message="Invalid Last-Event-ID"), 400
+
+    # Subscribe before replaying so nothing committed in between is lost; live
+    # messages already covered by the replay are skipped by id below.
+    subscription = pubsub.subscribe()
+    if subscription is None:
+        return jsonify(success=False, message="Live updates are unavailable"), 503
+
+    try:
+        replay = _replay_since(last_event_id) if last_event_id is not None else []
+    except Exception as e:
+        subscription.close()
+        current_app.logger.error(f"[STATUS STREAM ERROR]: {e}")
+        return jsonify(success=False, message="Failed to open status stream"), 500
+
+    high_water = replay[-1]["id"] if replay else last_event_id or 0
+    heartbeat = current_app.config.get("STREAM_HEARTBEAT_SECONDS", 15)
+    # Release the pooled connection now; the stream can stay open for hours.
+    db.session.remove()
+
+    def generate():
+        try:
+            yield "retry: 3000\n\n"
+            for message in replay:
+                yield _frame(message)
+            while True:
+                message = subscription.get(heartbeat)
+                if message is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message.get("id") is not None and message["id"] <= high_water:
+                    continue
+                yield _frame(message)
+        finally:
+            subscription.close()
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
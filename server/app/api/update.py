@@ -1,8 +1,10 @@
 from flask import jsonify, request, Blueprint, current_app
+from app import cache, pubsub
 from app.extensions import db
 from flask_login import current_user, login_required
 from app.models import (
     Machine, 
+    MachineEdit, 
     User, 
     MachineNote, 
     WorkOrder, 
@@ -15,6 +17,7 @@ from app.models import (
     StatusEnum, 
     VendorEnum
 )
+from app.models.technician_daily_rollups import move_machine_category
 from datetime import datetime, timezone, date
 
 update_bp = Blueprint("update", __name__)
@@ -64,6 +67,7 @@ def update_current_user():
 
     try:
         db.session.commit()
+        cache.invalidate("users", f"user:{current_user.id}")
         return jsonify(
             success=True,
             message="Profile updated",
@@ -110,6 +114,7 @@ def update_work_order_status(work_order_id):
         work_order.closed_on = date.today()
     elif new_status == StatusEnum.IN_PROGRESS:
         work_order.closed_on = None
+    work_order.machine.sync_latest_work_order(work_order)
 
     event = WorkOrderEvent(
         work_order_id=work_order.id,
@@ -124,6 +129,8 @@ def update_work_order_status(work_order_id):
 
     try:
         db.session.commit()
+        cache.invalidate("machines", "events", f"machine:{work_order.machine_id}", f"user:{current_user.id}")
+        pubsub.publish_status_change(event, work_order.machine)
         return jsonify(
             success=True,
             message="Work order status updated",
@@ -146,6 +153,9 @@ def update_machine_fields(machine_id):
     if not data:
         return jsonify(success=False, message="No payload in request"), 400
 
+    previous_search_values = (machine.serial, machine.model)
+    previous_category = machine.category
+
     if "brand" in data and data["brand"] is not None:
         machine.brand = str(data["brand"]).strip().lower()
     if "model" in data and data["model"] is not None:
@@ -179,8 +189,19 @@ def update_machine_fields(machine_id):
     except ValueError:
         return jsonify(success=False, message="Invalid category, condition, or vendor"), 400
 
+    if (machine.serial, machine.model) != previous_search_values:
+        machine.reindex_search_grams()
+
+    invalidated = ["machines", f"machine:{machine.id}"]
+    if machine.category != previous_category:
+        move_machine_category(db.session.connection(), machine.id, previous_category, machine.category)
+        invalidated.append("metrics")
+
+    db.session.add(MachineEdit(machine_id=machine.id, edited_by=current_user.id))
+
     try:
         db.session.commit()
+        cache.invalidate(*invalidated)
         return jsonify(success=True, message="Machine updated", machine=machine.serialize()), 200
     except Exception as e:
         db.session.rollback()
@@ -0,0 +1,162 @@
+import hashlib
+import json
+from functools import wraps
+from urllib.parse import urlencode
+
+from flask import current_app, request
+from redis.exceptions import RedisError
+
+# Generational invalidation: every cached value is stored under a key that embeds
+# the current version of each tag it depends on. Writers bump tag versions after
+# commit, which orphans stale entries instead of hunting them down; they expire
+# via their TTL.
+
+
+def _client():
+    if not current_app.config.get("CACHE_ENABLED", True):
+        return None
+    return current_app.config.get("CACHE_REDIS")
+
+
+def _key(*parts) -> str:
+    return current_app.config.get("CACHE_KEY_PREFIX", "blu:cache:") + ":".join(str(p) for p in parts)
+
+
+def tag_versions(*tags) -> list[int] | None:
+    client = _client()
+    if client is None:
+        return None
+    try:
+        values = client.mget([_key("tag", tag) for tag in tags])
+    except RedisError as e:
+        current_app.logger.warning(f"[CACHE ERROR]: {e}")
+        return None
+    return [int(v) if v is not None else 0 for v in values]
+
+
+def invalidate(*tags) -> None:
+    client = _client()
+    if client is None or not tags:
+        return
+    try:
+        pipe = client.pipeline(transaction=False)
+        for tag in tags:
+            pipe.incr(_key("tag", tag))
+        pipe.execute()
+    except RedisError as e:
+        current_app.logger.warning(f"[CACHE ERROR]: {e}")
+
+
+def versioned_key(name: str, tags: list[str], *parts) -> str | None:
+    versions = tag_versions(*tags)
+    if versions is None:
+        return None
+    stamp = ".".join(f"{tag}={version}" for tag, version in zip(tags, versions))
+    return _key(name, stamp, *parts)
+
+
+def get_json(key: str | None):
+    client = _client()
+    if client is None or key is None:
+        return None
+    try:
+        raw = client.get(key)
+    except RedisError as e:
+        current_app.logger.warning(f"[CACHE ERROR]: {e}")
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+def set_json(key: str | None, value, timeout: int | None = None) -> None:
+    client = _client()
+    if client is None or key is None:
+        return
+    try:
+        client.set(key, json.dumps(value), ex=timeout or current_app.config.get("CACHE_DEFAULT_TIMEOUT", 300))
+    except RedisError as e:
+        current_app.logger.warning(f"[CACHE ERROR]: {e}")
+
+
+def weak_etag(tags: list[str], *parts, tags_optional: bool = False) -> str | None:
+    """Hash of the tag versions plus parts; None when versions are unreadable.
+
+    With tags_optional the parts alone are hashed instead, for callers whose
+    parts already change with every write the tags would have tracked.
+    """
+    versions = tag_versions(*tags)
+    if versions is None:
+        if not tags_optional:
+            return None
+        tags, versions = [], []
+    raw = ":".join(str(p) for p in [*zip(tags, versions), *parts])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _record(endpoint: str, outcome: str) -> None:
+    client = _client()
+    if client is None:
+        return
+    try:
+        client.hincrby(_key("stats"), f"{endpoint}:{outcome}", 1)
+    except RedisError as e:
+        current_app.logger.warning(f"[CACHE ERROR]: {e}")
+
+
+def stats() -> dict:
+    client = _client()
+    if client is None:
+        return {}
+    try:
+        raw = client.hgetall(_key("stats"))
+    except RedisError as e:
+        current_app.logger.warning(f"[CACHE ERROR]: {e}")
+        return {}
+
+    result = {}
+    for field, value in raw.items():
+        endpoint, outcome = field.decode("utf-8").rsplit(":", 1)
+        result.setdefault(endpoint, {"hits": 0, "misses": 0})[outcome] = int(value)
+    for counts in result.values():
+        total = counts["hits"] + counts["misses"]
+        counts["hit_rate"] = round(counts["hits"] / total, 4) if total else 0.0
+    return result
+
+
+def cached_response(tags, timeout: int | None = None):
+    """Cache a view's successful JSON response under the versions of ``tags``.
+
+    ``tags`` is a list, or a callable receiving the view args and returning one.
+    A hit replays the stored body and ETag (answering 304 when it matches).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            view_tags = tags(**kwargs) if callable(tags) else tags
+            key = versioned_key(
+                f"view:{request.endpoint}",
+                view_tags,
+                request.path,
+                urlencode(sorted(request.args.items(multi=True))),
+            )
+            cached = get_json(key)
+            if cached is not None:
+                _record(request.endpoint, "hits")
+                etag = cached.get("etag")
+                if etag and request.if_none_match.contains_weak(etag):
+                    response = current_app.response_class(status=304)
+                else:
+                    response = current_app.response_class(cached["body"], status=200, mimetype="application/json")
+                if etag:
+                    response.set_etag(etag, weak=True)
+                    response.headers["Cache-Control"] = "private, no-cache"
+                return response
+
+            if key is not None:
+                _record(request.endpoint, "misses")
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code == 200 and response.mimetype == "application/json":
+                etag, _ = response.get_etag()
+                set_json(key, {"body": response.get_data(as_text=True), "etag": etag}, timeout)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,167 @@
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from flask import current_app, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Per-request SQL accounting. Engine-level cursor events feed every active
+# QueryStats collector (the request's own, plus any query_budget() opened by a
+# test), so the numbers cover lazy loads and relationship loads, not just the
+# queries a view issues explicitly.
+
+_collectors: ContextVar[tuple] = ContextVar("query_stats_collectors", default=())
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s|:\w+)(?:\s*,\s*(?:\?|%s|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Collapse literals and expanded IN lists so repeats of one query shape match."""
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("(?)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    fingerprints: dict[str, int] = field(default_factory=dict)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        key = fingerprint(statement)
+        self.fingerprints[key] = self.fingerprints.get(key, 0) + 1
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 3)
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        return {stmt: n for stmt, n in self.fingerprints.items() if n > threshold}
+
+    @property
+    def max_repeats(self) -> int:
+        return max(self.fingerprints.values(), default=0)
+
+
+def attach(collector):
+    """Feed every statement in the current context to ``collector.record()``.
+
+    Returns a token for detach(). Collectors nest; each sees all statements.
+    """
+    return _collectors.set(_collectors.get() + (collector,))
+
+
+def detach(token) -> None:
+    _collectors.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _collectors.get():
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    collectors = _collectors.get()
+    if not collectors:
+        return
+    starts = conn.info.get("query_start_times")
+    duration = time.perf_counter() - starts.pop() if starts else 0.0
+    for stats in collectors:
+        stats.record(statement, duration)
+
+
+def install_listeners() -> None:
+    # Listeners live on the Engine class so every engine Flask-SQLAlchemy
+    # creates is covered; guard against double registration across create_app calls.
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _start_request():
+    stats = QueryStats()
+    request.environ["blu.query_stats"] = (stats, attach(stats))
+
+
+def _finish_request(response):
+    entry = request.environ.get("blu.query_stats")
+    if entry is None:
+        return response
+    stats, _ = entry
+
+    threshold = current_app.config.get("QUERY_REPEAT_WARN_THRESHOLD", 10)
+    for statement, n in stats.repeated(threshold).items():
+        current_app.logger.warning(
+            f"[N+1 WARNING]: {request.method} {request.path} ran the same statement {n} times: {statement[:300]}"
+        )
+
+    if current_app.config.get("QUERY_STATS_HEADERS", current_app.debug):
+        response.headers["X-Query-Count"] = str(stats.count)
+        response.headers["X-Query-Time-Ms"] = str(stats.duration_ms)
+        response.headers["X-Query-Max-Repeats"] = str(stats.max_repeats)
+    return response
+
+
+def _teardown_request(exc):
+    entry = request.environ.pop("blu.query_stats", None) if has_request_context() else None
+    if entry is not None:
+        detach(entry[1])
+
+
+def current_stats() -> QueryStats | None:
+    """The collector for the active request, if instrumentation is on."""
+    if not has_request_context():
+        return None
+    entry = request.environ.get("blu.query_stats")
+    return entry[0] if entry else None
+
+
+def init_app(app) -> None:
+    if not app.config.get("QUERY_INSTRUMENTATION_ENABLED", True):
+        return
+
+    install_listeners()
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    app.teardown_request(_teardown_request)
+
+
+@contextmanager
+def query_budget(max_queries: int | None = None, max_repeats: int | None = None):
+    """Assert a block stays within a query budget; for use in pytest tests.
+
+        with query_budget(max_queries=4, max_repeats=1) as stats:
+            client.get("/api/read/machines?per_page=50")
+
+    Counts queries from test-client requests as well as direct model calls.
+    Raises AssertionError listing the repeated statements when the budget is
+    exceeded.
+    """
+    install_listeners()
+
+    stats = QueryStats()
+    token = attach(stats)
+    try:
+        yield stats
+    finally:
+        detach(token)
+
+    problems = []
+    if max_queries is not None and stats.count > max_queries:
+        problems.append(f"{stats.count} queries ran (budget {max_queries})")
+    if max_repeats is not None and stats.max_repeats > max_repeats:
+        repeated = "\n  ".join(f"{n}x {stmt[:200]}" for stmt, n in stats.repeated(max_repeats).items())
+        problems.append(f"statements repeated more than {max_repeats} times:\n  {repeated}")
+    if problems:
+        raise AssertionError("Query budget exceeded: " + "; ".join(problems))
@@ -4,6 +4,10 @@ from .machines import Machine
 from .work_orders import WorkOrder
 from .work_order_events import WorkOrderEvent
 from .machine_notes import MachineNote
+from .machine_search_grams import MachineSearchGram
+from .machine_note_tokens import MachineNoteToken
+from .technician_daily_rollups import TechnicianDailyRollup
+from .machine_edits import MachineEdit
 from .enums import (
     ConditionEnum, 
     RoleEnum, 
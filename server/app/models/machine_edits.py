@@ -0,0 +1,38 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, String, ForeignKey, DateTime
+from .base import Base
+from datetime import datetime, timezone
+
+EDIT_UPDATED = "updated"
+EDIT_DELETED = "deleted"
+EDIT_WORK_ORDER_DELETED = "work_order_deleted"
+EDIT_NOTE_DELETED = "note_deleted"
+
+
+class MachineEdit(Base):
+    """Append-only log of machine changes that do not produce a work order event.
+
+    The id is the change feed watermark for field edits and deletes; events and
+    notes already carry their own monotonic ids. machine_id, work_order_id and
+    note_id have no FK so rows outlive the records they describe.
+    """
+    __tablename__ = "machine_edits"
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    machine_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    work_order_id: Mapped[int] = mapped_column(Integer, nullable=True)
+    note_id: Mapped[int] = mapped_column(Integer, nullable=True)
+    action: Mapped[str] = mapped_column(String(20), nullable=False, default=EDIT_UPDATED)
+    edited_by: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    edited_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    
+    def serialize(self) -> dict:
+        return {
+            "id": self.id,
+            "machine_id": self.machine_id,
+            "work_order_id": self.work_order_id,
+            "note_id": self.note_id,
+            "action": self.action,
+            "edited_by": self.edited_by,
+            "edited_at": self.edited_at.isoformat()
+        }
@@ -0,0 +1,42 @@
+import re
+from collections import Counter
+
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Integer, String, ForeignKey, Index
+from .base import Base
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+MIN_TOKEN_LENGTH = 2
+MAX_TOKEN_LENGTH = 64
+
+
+def tokenize(content: str) -> Counter:
+    return Counter(
+        token[:MAX_TOKEN_LENGTH]
+        for token in TOKEN_PATTERN.findall((content or "").lower())
+        if len(token) >= MIN_TOKEN_LENGTH
+    )
+
+
+def token_rows(note_id: int, machine_id: int, content: str) -> list[dict]:
+    return [
+        {"note_id": note_id, "machine_id": machine_id, "token": token, "frequency": frequency}
+        for token, frequency in tokenize(content).items()
+    ]
+
+
+class MachineNoteToken(Base):
+    """Inverted index over MachineNote.content, one row per (note, token)."""
+    __tablename__ = "machine_note_tokens"
+    __table_args__ = (
+        Index("ix_machine_note_tokens_token_machine_id", "token", "machine_id", "frequency"),
+    )
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    note_id: Mapped[int] = mapped_column(Integer, ForeignKey("machine_notes.id"), nullable=False, index=True)
+    machine_id: Mapped[int] = mapped_column(Integer, ForeignKey("machines.id"), nullable=False)
+    token: Mapped[str] = mapped_column(String(MAX_TOKEN_LENGTH), nullable=False)
+    frequency: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    
+    #----------relationships--------------
+    note = relationship("MachineNote", back_populates="tokens")
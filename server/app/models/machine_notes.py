@@ -1,10 +1,13 @@
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, ForeignKey, Text, Date
+from sqlalchemy.orm import Mapped, mapped_column, relationship, object_session
+from sqlalchemy import Integer, ForeignKey, Text, Date, Index, delete, insert
 from .base import Base
 from datetime import date as DTdate
 
 class MachineNote(Base):
     __tablename__ = "machine_notes"
+    __table_args__ = (
+        Index("ix_machine_notes_machine_id_added_on", "machine_id", "added_on"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
@@ -15,6 +18,21 @@ class MachineNote(Base):
     #----------relationships--------------
     machine = relationship("Machine", back_populates="notes")
     technician = relationship("User", back_populates="machine_notes", foreign_keys=[technician_id])
+    tokens = relationship("MachineNoteToken", back_populates="note", cascade="all, delete-orphan")
+    
+    def reindex_tokens(self) -> None:
+        # Same single-statement rewrite as Machine.reindex_search_grams.
+        from .machine_note_tokens import MachineNoteToken, token_rows
+        
+        session = object_session(self)
+        if self.id is None:
+            session.flush()
+        tokens = MachineNoteToken.__table__
+        session.execute(delete(tokens).where(tokens.c.note_id == self.id))
+        rows = token_rows(self.id, self.machine_id, self.content)
+        if rows:
+            session.execute(insert(tokens).values(rows))
+        session.expire(self, ["tokens"])
     
     def serialize(self) -> dict:
         return {
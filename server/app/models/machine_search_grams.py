@@ -0,0 +1,46 @@
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Integer, String, ForeignKey, Index
+from .base import Base
+
+SEARCH_FIELDS = ("serial", "model")
+GRAM_SIZE = 3
+START_MARKER = "^"
+END_MARKER = "$"
+
+
+def grams_for_value(value: str) -> set[str]:
+    padded = f"{START_MARKER}{(value or '').strip().upper()}{END_MARKER}"
+    return {padded[i:i + GRAM_SIZE] for i in range(len(padded) - GRAM_SIZE + 1)}
+
+
+def search_gram_rows(machine_id: int, values: dict) -> list[dict]:
+    """Insert rows for one machine; values maps each SEARCH_FIELDS name to its value."""
+    return [
+        {"machine_id": machine_id, "field": field, "gram": gram}
+        for field in SEARCH_FIELDS
+        for gram in grams_for_value(values[field])
+    ]
+
+
+def grams_for_term(term: str) -> set[str]:
+    return {term[i:i + GRAM_SIZE] for i in range(len(term) - GRAM_SIZE + 1)}
+
+
+class MachineSearchGram(Base):
+    """Trigram side table for fragment search on machine serial/model.
+
+    Values are indexed with ^/$ boundary markers so prefix and suffix
+    lookups resolve from the same (field, gram) index as substring lookups.
+    """
+    __tablename__ = "machine_search_grams"
+    __table_args__ = (
+        Index("ix_machine_search_grams_field_gram_machine_id", "field", "gram", "machine_id"),
+    )
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    machine_id: Mapped[int] = mapped_column(Integer, ForeignKey("machines.id"), nullable=False, index=True)
+    field: Mapped[str] = mapped_column(String(10), nullable=False)
+    gram: Mapped[str] = mapped_column(String(GRAM_SIZE), nullable=False)
+    
+    #----------relationships--------------
+    machine = relationship("Machine", back_populates="search_grams")
@@ -1,11 +1,13 @@
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship, object_session
+from sqlalchemy import String, Integer, Index, delete, insert
 from .base import Base
 from .enums import (
     ConditionEnum,
     ConditionEnumSA,
     CategoryEnum,
     CategoryEnumSA,
+    StatusEnum,
+    StatusEnumSA,
     VendorEnum,
     VendorEnumSA
 )
@@ -13,6 +15,9 @@ from .enums import (
 
 class Machine(Base):
     __tablename__ = "machines"
+    __table_args__ = (
+        Index("ix_machines_current_status_latest_work_order_id", "current_status", "latest_work_order_id"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     
@@ -26,18 +31,56 @@ class Machine(Base):
     condition: Mapped[ConditionEnum] = mapped_column(ConditionEnumSA, nullable=False)
     vendor: Mapped[VendorEnum] = mapped_column(VendorEnumSA, nullable=False, default=VendorEnum.UNKNOWN)
     
+    #----------denormalized latest work order--------------
+    # Kept in sync on every work order write (see sync_latest_work_order) so list,
+    # search and status filters never have to recompute max(work_orders.id).
+    # No FK constraint: work_orders already references machines, and a cycle would
+    # complicate machine deletes.
+    latest_work_order_id: Mapped[int] = mapped_column(Integer, nullable=True, index=True)
+    current_status: Mapped[StatusEnum] = mapped_column(StatusEnumSA, nullable=True)
+    
     #----------relationships--------------
     work_orders = relationship("WorkOrder", back_populates="machine", cascade="all, delete-orphan")
     work_order_events = relationship("WorkOrderEvent", back_populates="machine")
     notes = relationship("MachineNote", back_populates="machine")
+    search_grams = relationship("MachineSearchGram", back_populates="machine", cascade="all, delete-orphan")
+    latest_work_order = relationship(
+        "WorkOrder",
+        primaryjoin="foreign(Machine.latest_work_order_id) == WorkOrder.id",
+        viewonly=True,
+    )
     
-    @property
-    def current_status(self):
-        if not self.work_orders:
-            return None
-        latest_work_order = max(self.work_orders, key=lambda wo: wo.id)
-        return latest_work_order.current_status
+    def sync_latest_work_order(self, work_order) -> None:
+        if self.latest_work_order_id is not None and work_order.id < self.latest_work_order_id:
+            return
+        self.latest_work_order_id = work_order.id
+        self.current_status = work_order.current_status
+        
+    def refresh_latest_work_order(self) -> None:
+        from .work_orders import WorkOrder
+        
+        latest = (
+            object_session(self)
+            .query(WorkOrder)
+            .filter(WorkOrder.machine_id == self.id)
+            .order_by(WorkOrder.id.desc())
+            .first()
+        )
+        self.latest_work_order_id = latest.id if latest else None
+        self.current_status = latest.current_status if latest else None
+        
+    def reindex_search_grams(self) -> None:
+        # One DELETE and one multi-row INSERT rather than an ORM insert per gram.
+        # The machine must already be in a session; it is flushed if it has no id yet.
+        from .machine_search_grams import MachineSearchGram, SEARCH_FIELDS, search_gram_rows
         
+        session = object_session(self)
+        if self.id is None:
+            session.flush()
+        grams = MachineSearchGram.__table__
+        session.execute(delete(grams).where(grams.c.machine_id == self.id))
+        session.execute(insert(grams).values(search_gram_rows(self.id, {field: getattr(self, field) for field in SEARCH_FIELDS})))
+        session.expire(self, ["search_grams"])
     
     
     def serialize(self, include_notes=False) -> dict:
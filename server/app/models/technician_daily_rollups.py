@@ -0,0 +1,135 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, ForeignKey, Date, UniqueConstraint, event, func, select, update
+from .base import Base
+from .enums import (
+    CategoryEnum,
+    CategoryEnumSA,
+    EventEnum,
+    EventEnumSA,
+    EventReasonEnum,
+    EventReasonEnumSA,
+)
+from .machines import Machine
+from .work_order_events import WorkOrderEvent
+from datetime import date as DTdate
+
+ROLLUP_KEY_COLUMNS = ("technician_id", "event_date", "event_type", "reason", "category")
+
+
+class TechnicianDailyRollup(Base):
+    """Event counts per (technician, day, event type, reason, machine category).
+
+    Maintained by the WorkOrderEvent mapper hooks below, inside the same flush
+    that writes the event, so totals never drift from work_order_events.
+    """
+    __tablename__ = "technician_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint(*ROLLUP_KEY_COLUMNS, name="uq_technician_daily_rollups_key"),
+    )
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    technician_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    event_date: Mapped[DTdate] = mapped_column(Date, nullable=False)
+    event_type: Mapped[EventEnum] = mapped_column(EventEnumSA, nullable=False)
+    reason: Mapped[EventReasonEnum] = mapped_column(EventReasonEnumSA, nullable=False, default=EventReasonEnum.DEFAULT)
+    category: Mapped[CategoryEnum] = mapped_column(CategoryEnumSA, nullable=False)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+def _rollup_key(connection, target: WorkOrderEvent) -> dict | None:
+    machine = target.__dict__.get("machine")
+    category = (
+        machine.category
+        if machine is not None
+        else connection.execute(select(Machine.category).where(Machine.id == target.machine_id)).scalar()
+    )
+    if category is None:
+        return None
+    return {
+        "technician_id": target.technician_id,
+        "event_date": target.event_date,
+        "event_type": target.event_type,
+        "reason": target.reason or EventReasonEnum.DEFAULT,
+        "category": category,
+    }
+
+
+def _upsert_statement(dialect_name: str, key: dict, count: int = 1):
+    table = TechnicianDailyRollup.__table__
+    if dialect_name == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+        
+        return insert(table).values(**key, event_count=count).on_duplicate_key_update(
+            event_count=table.c.event_count + count
+        )
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    
+    return insert(table).values(**key, event_count=count).on_conflict_do_update(
+        index_elements=list(ROLLUP_KEY_COLUMNS),
+        set_={"event_count": table.c.event_count + count},
+    )
+
+
+@event.listens_for(WorkOrderEvent, "after_insert")
+def _increment_rollup(mapper, connection, target):
+    key = _rollup_key(connection, target)
+    if key is not None:
+        connection.execute(_upsert_statement(connection.dialect.name, key))
+
+
+def increment_rollups(connection, counts: dict[tuple, int]) -> None:
+    """Add event counts keyed by ROLLUP_KEY_COLUMNS tuples.
+
+    For events written with Core/bulk inserts, which skip the mapper hooks below.
+    """
+    for key, count in counts.items():
+        connection.execute(_upsert_statement(connection.dialect.name, dict(zip(ROLLUP_KEY_COLUMNS, key)), count))
+
+
+def move_machine_category(connection, machine_id: int, old_category: CategoryEnum, new_category: CategoryEnum) -> None:
+    """Re-key a machine's event counts after its category is edited.
+
+    The rollup key embeds the category, so without this later decrements for the
+    machine's events would miss the old rows and the totals would drift.
+    """
+    if old_category == new_category:
+        return
+    table = TechnicianDailyRollup.__table__
+    reason = func.coalesce(WorkOrderEvent.reason, EventReasonEnum.DEFAULT)
+    rows = connection.execute(
+        select(
+            WorkOrderEvent.technician_id,
+            WorkOrderEvent.event_date,
+            WorkOrderEvent.event_type,
+            reason,
+            func.count(WorkOrderEvent.id),
+        )
+        .where(WorkOrderEvent.machine_id == machine_id)
+        .group_by(WorkOrderEvent.technician_id, WorkOrderEvent.event_date, WorkOrderEvent.event_type, reason)
+    ).all()
+    moved = {}
+    for technician_id, event_date, event_type, event_reason, count in rows:
+        old_key = (technician_id, event_date, event_type, event_reason, old_category)
+        connection.execute(
+            update(table)
+            .where(*[table.c[column] == value for column, value in zip(ROLLUP_KEY_COLUMNS, old_key)])
+            .values(event_count=table.c.event_count - count)
+        )
+        moved[(*old_key[:4], new_category)] = count
+    increment_rollups(connection, moved)
+
+
+@event.listens_for(WorkOrderEvent, "after_delete")
+def _decrement_rollup(mapper, connection, target):
+    table = TechnicianDailyRollup.__table__
+    key = _rollup_key(connection, target)
+    if key is None:
+        return
+    connection.execute(
+        update(table)
+        .where(*[table.c[column] == value for column, value in key.items()])
+        .values(event_count=table.c.event_count - 1)
+    )
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, ForeignKey, Date
+from sqlalchemy import Integer, ForeignKey, Date, Index
 from .base import Base
 from .enums import EventEnum, EventEnumSA, EventReasonEnum, EventReasonEnumSA, StatusEnum, StatusEnumSA
 from datetime import date as DTdate
@@ -7,6 +7,12 @@ from datetime import date as DTdate
 
 class WorkOrderEvent(Base):
     __tablename__ = "work_order_events"
+    __table_args__ = (
+        Index("ix_work_order_events_technician_id_event_date", "technician_id", "event_date", "event_type"),
+        Index("ix_work_order_events_machine_id_event_date", "machine_id", "event_date"),
+        Index("ix_work_order_events_work_order_id", "work_order_id"),
+        Index("ix_work_order_events_event_type_work_order_id", "event_type", "work_order_id"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     
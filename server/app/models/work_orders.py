@@ -1,11 +1,16 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, Date, ForeignKey
+from sqlalchemy import Integer, Date, ForeignKey, Index
 from .base import Base
 from .enums import StatusEnum, StatusEnumSA
 from datetime import date as DTdate
 
 class WorkOrder(Base):
     __tablename__ = "work_orders"
+    __table_args__ = (
+        Index("ix_work_orders_machine_id_id", "machine_id", "id"),
+        Index("ix_work_orders_initiated_by_initiated_on", "initiated_by", "initiated_on"),
+        Index("ix_work_orders_closed_on", "closed_on"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     
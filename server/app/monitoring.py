@@ -0,0 +1,151 @@
+import os
+import time
+
+from flask import request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Prometheus metrics for the API. Under gunicorn, export PROMETHEUS_MULTIPROC_DIR
+# (an empty directory, wiped on deploy) before the workers start: prometheus_client
+# then writes each worker's samples to mmap files there and render() merges them,
+# so any worker can answer a scrape. Add to gunicorn.conf.py:
+#
+#     from app.monitoring import child_exit
+#
+# so a dead worker's live gauges are dropped.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+REQUEST_LATENCY = Histogram(
+    "blu_http_request_duration_seconds",
+    "Request latency by endpoint.",
+    ["method", "endpoint"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_COUNT = Counter(
+    "blu_http_requests_total",
+    "Requests by endpoint and status code.",
+    ["method", "endpoint", "status"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "blu_http_requests_in_progress",
+    "Requests currently being handled.",
+    ["method", "endpoint"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT = Histogram(
+    "blu_db_pool_checkout_seconds",
+    "Time spent waiting for a pooled database connection.",
+    buckets=FAST_BUCKETS,
+)
+SESSION_LATENCY = Histogram(
+    "blu_redis_session_seconds",
+    "Time spent loading and saving the Redis-backed session.",
+    ["operation"],
+    buckets=FAST_BUCKETS,
+)
+
+
+def _endpoint() -> str:
+    # Unmatched URLs share one label so scanners cannot blow up cardinality.
+    return request.endpoint or "unmatched"
+
+
+def _start_request():
+    labels = (request.method, _endpoint())
+    REQUESTS_IN_PROGRESS.labels(*labels).inc()
+    request.environ["blu.monitoring"] = {"start": time.perf_counter(), "labels": labels, "recorded": False}
+
+
+def _record(entry: dict, status: int) -> None:
+    REQUEST_LATENCY.labels(*entry["labels"]).observe(time.perf_counter() - entry["start"])
+    REQUEST_COUNT.labels(*entry["labels"], str(status)).inc()
+    entry["recorded"] = True
+
+
+def _finish_request(response):
+    entry = request.environ.get("blu.monitoring")
+    if entry is not None:
+        _record(entry, response.status_code)
+    return response
+
+
+def _teardown_request(exc):
+    entry = request.environ.pop("blu.monitoring", None)
+    if entry is None:
+        return
+    if not entry["recorded"]:
+        # after_request is skipped for unhandled exceptions.
+        _record(entry, 500)
+    REQUESTS_IN_PROGRESS.labels(*entry["labels"]).dec()
+
+
+def _instrument_pool(engine) -> None:
+    pool = engine.pool
+    if getattr(pool, "_blu_timed", False):
+        return
+    connect = pool.connect
+
+    def timed_connect():
+        start = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            DB_POOL_CHECKOUT.observe(time.perf_counter() - start)
+
+    pool.connect = timed_connect
+    pool._blu_timed = True
+
+
+def _instrument_session(app) -> None:
+    interface = app.session_interface
+    open_session = interface.open_session
+    save_session = interface.save_session
+
+    def timed_open(app_, request_):
+        with SESSION_LATENCY.labels("open").time():
+            return open_session(app_, request_)
+
+    def timed_save(app_, session_, response):
+        with SESSION_LATENCY.labels("save").time():
+            return save_session(app_, session_, response)
+
+    interface.open_session = timed_open
+    interface.save_session = timed_save
+
+
+def init_app(app, db) -> None:
+    if not app.config.get("PROMETHEUS_ENABLED", True):
+        return
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    app.teardown_request(_teardown_request)
+
+    with app.app_context():
+        _instrument_pool(db.engine)
+    _instrument_session(app)
+
+
+def render() -> tuple[bytes, str]:
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def child_exit(server, worker) -> None:
+    """gunicorn hook: drop a dead worker's livesum gauge files."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)
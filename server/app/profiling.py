@@ -0,0 +1,145 @@
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+
+from flask import current_app, request
+from flask_login import current_user
+
+from app import instrumentation
+from app.models import RoleEnum
+
+# On-demand profiling for admins: add ?__profile=1 or an X-Profile: 1 header to
+# any request. A background thread samples the request thread's stack and the
+# SQL instrumentation records each statement; both are written to PROFILE_DIR as
+# <id>.folded (flamegraph.pl / speedscope input) and <id>.json, and the id comes
+# back in X-Profile-Id. Requests without the flag only pay for the flag lookup.
+
+
+class StackSampler(threading.Thread):
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(daemon=True, name="blu-profiler")
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                names.append(_frame_name(frame))
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+            self.samples += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+class SqlTimeline:
+    def __init__(self):
+        self.statements = []
+
+    def record(self, statement: str, duration: float) -> None:
+        self.statements.append({"statement": statement, "duration_ms": round(duration * 1000, 3)})
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    filename = "/".join(code.co_filename.replace("\\", "/").split("/")[-2:])
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+def _requested() -> bool:
+    return request.args.get("__profile") == "1" or request.headers.get("X-Profile") == "1"
+
+
+def _start_profile():
+    if not _requested():
+        return
+    if not current_user.is_authenticated or current_user.role != RoleEnum.ADMIN:
+        return
+
+    timeline = SqlTimeline()
+    sampler = StackSampler(threading.get_ident(), current_app.config.get("PROFILE_SAMPLE_INTERVAL", 0.001))
+    request.environ["blu.profile"] = {
+        "id": f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}",
+        "start": time.perf_counter(),
+        "sampler": sampler,
+        "timeline": timeline,
+        "token": instrumentation.attach(timeline),
+    }
+    sampler.start()
+
+
+def _stop(entry: dict) -> float:
+    entry["sampler"].stop()
+    instrumentation.detach(entry["token"])
+    return time.perf_counter() - entry["start"]
+
+
+def _finish_profile(response):
+    entry = request.environ.pop("blu.profile", None)
+    if entry is None:
+        return response
+
+    wall = _stop(entry)
+    sampler, statements = entry["sampler"], entry["timeline"].statements
+    profile_dir = current_app.config.get("PROFILE_DIR") or os.path.join(os.getcwd(), "logs", "profiles")
+
+    try:
+        os.makedirs(profile_dir, exist_ok=True)
+        with open(os.path.join(profile_dir, f"{entry['id']}.folded"), "w", encoding="utf-8") as handle:
+            for stack, count in sampler.stacks.most_common():
+                handle.write(f"{stack} {count}\n")
+
+        slowest = sorted(statements, key=lambda s: s["duration_ms"], reverse=True)
+        summary = {
+            "id": entry["id"],
+            "method": request.method,
+            "path": request.full_path,
+            "endpoint": request.endpoint,
+            "status": response.status_code,
+            "wall_ms": round(wall * 1000, 3),
+            "samples": sampler.samples,
+            "sample_interval_ms": round(sampler.interval * 1000, 3),
+            "sql": {
+                "count": len(statements),
+                "duration_ms": round(sum(s["duration_ms"] for s in statements), 3),
+                "slowest": slowest[:10],
+                "statements": statements,
+            },
+        }
+        with open(os.path.join(profile_dir, f"{entry['id']}.json"), "w", encoding="utf-8") as handle:
+            json.dump(summary, handle, indent=2)
+    except OSError as e:
+        current_app.logger.error(f"[PROFILE WRITE ERROR]: {e}")
+        return response
+
+    current_app.logger.info(f"[PROFILE]: {request.method} {request.path} -> {entry['id']} ({summary['wall_ms']} ms)")
+    response.headers["X-Profile-Id"] = entry["id"]
+    return response
+
+
+def _teardown_profile(exc):
+    # Only reached with an entry when the view raised and after_request was skipped.
+    entry = request.environ.pop("blu.profile", None)
+    if entry is not None:
+        _stop(entry)
+
+
+def init_app(app) -> None:
+    instrumentation.install_listeners()
+    app.before_request(_start_profile)
+    app.after_request(_finish_profile)
+    app.teardown_request(_teardown_profile)
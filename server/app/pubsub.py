@@ -0,0 +1,127 @@
+import json
+import queue
+import threading
+import time
+
+from flask import current_app
+from redis.exceptions import RedisError
+
+# Status fan-out for the SSE stream. Writers publish after commit; every worker
+# process holds one Redis subscription per open stream, so a change made on any
+# worker reaches every connected screen. PUBSUB_BACKEND = "local" swaps Redis for
+# an in-process broker, which is enough for tests and a single dev server.
+
+
+class LocalBroker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queues: set[queue.Queue] = set()
+
+    def publish(self, raw: str) -> None:
+        with self._lock:
+            queues = list(self._queues)
+        for q in queues:
+            q.put(raw)
+
+    def subscribe(self) -> "LocalSubscription":
+        q = queue.Queue()
+        with self._lock:
+            self._queues.add(q)
+        return LocalSubscription(self, q)
+
+    def _unsubscribe(self, q: queue.Queue) -> None:
+        with self._lock:
+            self._queues.discard(q)
+
+
+class LocalSubscription:
+    def __init__(self, broker: LocalBroker, q: queue.Queue):
+        self._broker = broker
+        self._queue = q
+
+    def get(self, timeout: float) -> dict | None:
+        try:
+            return json.loads(self._queue.get(timeout=timeout))
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        self._broker._unsubscribe(self._queue)
+
+
+class RedisSubscription:
+    def __init__(self, client, channel: str):
+        self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(channel)
+
+    def get(self, timeout: float) -> dict | None:
+        # get_message returns None for control frames as well as on timeout, so
+        # keep polling until the deadline rather than heartbeating early.
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            message = self._pubsub.get_message(timeout=remaining)
+            if message and message["type"] == "message":
+                return json.loads(message["data"])
+
+    def close(self) -> None:
+        try:
+            self._pubsub.close()
+        except RedisError:
+            pass
+
+
+def _local_broker() -> LocalBroker:
+    return current_app.extensions.setdefault("pubsub_local_broker", LocalBroker())
+
+
+def _is_local() -> bool:
+    return current_app.config.get("PUBSUB_BACKEND", "redis") == "local"
+
+
+def _channel() -> str:
+    return current_app.config.get("PUBSUB_CHANNEL", "blu:status")
+
+
+def publish(event_type: str, event_id: int | None, data: dict) -> None:
+    raw = json.dumps({"type": event_type, "id": event_id, "data": data})
+    if _is_local():
+        _local_broker().publish(raw)
+        return
+
+    client = current_app.config.get("PUBSUB_REDIS")
+    if client is None:
+        return
+    try:
+        client.publish(_channel(), raw)
+    except RedisError as e:
+        current_app.logger.warning(f"[PUBSUB ERROR]: {e}")
+
+
+def status_message(event, machine) -> dict:
+    return {
+        **event.serialize(),
+        "serial": machine.serial,
+        "current_status": str(machine.current_status) if machine.current_status else None,
+    }
+
+
+def publish_status_change(event, machine) -> None:
+    publish("status", event.id, status_message(event, machine))
+
+
+def subscribe():
+    """Open a subscription; returns None when Redis is unavailable."""
+    if _is_local():
+        return _local_broker().subscribe()
+
+    client = current_app.config.get("PUBSUB_REDIS")
+    if client is None:
+        return None
+    try:
+        return RedisSubscription(client, _channel())
+    except RedisError as e:
+        current_app.logger.warning(f"[PUBSUB ERROR]: {e}")
+        return None
@@ -0,0 +1,198 @@
+from datetime import date
+
+import msgspec
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+
+# Typed response shapes mirroring the models' serialize() output. Encoding a
+# Struct skips building an intermediate dict per row and msgspec writes dates
+# and str enums natively, so hot list endpoints hand these straight to
+# encode_response(). Everything else still goes through jsonify(), which the
+# MsgspecJSONProvider below routes through the same encoder.
+
+
+class UserSchema(msgspec.Struct):
+    id: int
+    first_name: str
+    last_name: str
+    email: str
+    role: str
+
+    @classmethod
+    def from_model(cls, user) -> "UserSchema":
+        return cls(
+            id=user.id,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            email=user.email,
+            role=str(user.role),
+        )
+
+
+class InitiatorSchema(msgspec.Struct):
+    id: int
+    first_name: str
+    last_name: str
+
+
+class WorkOrderSchema(msgspec.Struct):
+    id: int
+    machine_id: int
+    initiated_on: date
+    initiator: InitiatorSchema
+    current_status: str
+    closed_on: date | None
+    archived_on: date | None
+
+    @classmethod
+    def from_model(cls, work_order) -> "WorkOrderSchema":
+        initiator = work_order.initiator
+        return cls(
+            id=work_order.id,
+            machine_id=work_order.machine_id,
+            initiated_on=work_order.initiated_on,
+            initiator=InitiatorSchema(id=initiator.id, first_name=initiator.first_name, last_name=initiator.last_name),
+            current_status=str(work_order.current_status),
+            closed_on=work_order.closed_on,
+            archived_on=work_order.archived_on,
+        )
+
+
+class WorkOrderEventSchema(msgspec.Struct):
+    id: int
+    work_order_id: int
+    machine_id: int
+    event_type: str
+    from_status: str
+    to_status: str
+    event_date: date
+    technician_id: int
+    reason: str
+
+    @classmethod
+    def from_model(cls, event) -> "WorkOrderEventSchema":
+        return cls(
+            id=event.id,
+            work_order_id=event.work_order_id,
+            machine_id=event.machine_id,
+            event_type=str(event.event_type),
+            from_status=str(event.from_status),
+            to_status=str(event.to_status),
+            event_date=event.event_date,
+            technician_id=event.technician_id,
+            reason=str(event.reason),
+        )
+
+
+class MachineNoteSchema(msgspec.Struct):
+    id: int
+    content: str
+    added_on: date
+    technician_id: int
+    machine_id: int
+
+    @classmethod
+    def from_model(cls, note) -> "MachineNoteSchema":
+        return cls(
+            id=note.id,
+            content=note.content,
+            added_on=note.added_on,
+            technician_id=note.technician_id,
+            machine_id=note.machine_id,
+        )
+
+
+class NoteTechnicianSchema(msgspec.Struct):
+    first_name: str
+    last_name: str
+
+
+class MachineNoteEntrySchema(msgspec.Struct):
+    id: int
+    content: str
+    added_on: date
+    machine_id: int
+    technician: NoteTechnicianSchema
+
+
+class MachineSchema(msgspec.Struct):
+    id: int
+    brand: str
+    model: str
+    serial: str
+    category: str
+    form_factor: str
+    color: str
+    condition: str
+    vendor: str
+    current_status: str | None
+    notes: list[MachineNoteEntrySchema] | None
+    # UNSET is omitted on encode, matching serialize() which has no such key.
+    latest_work_order: WorkOrderSchema | None | msgspec.UnsetType = msgspec.UNSET
+
+    @classmethod
+    def from_model(cls, machine, latest_work_order=msgspec.UNSET, include_notes: bool = False) -> "MachineSchema":
+        if latest_work_order is not None and latest_work_order is not msgspec.UNSET:
+            latest_work_order = WorkOrderSchema.from_model(latest_work_order)
+        notes = None
+        if include_notes:
+            notes = [
+                MachineNoteEntrySchema(
+                    id=n.id,
+                    content=n.content,
+                    added_on=n.added_on,
+                    machine_id=n.machine_id,
+                    technician=NoteTechnicianSchema(first_name=n.technician.first_name, last_name=n.technician.last_name),
+                )
+                for n in machine.notes
+            ]
+        return cls(
+            id=machine.id,
+            brand=machine.brand,
+            model=machine.model,
+            serial=machine.serial,
+            category=str(machine.category),
+            form_factor=machine.form_factor,
+            color=machine.color,
+            condition=str(machine.condition),
+            vendor=str(machine.vendor),
+            current_status=str(machine.current_status) if machine.current_status else None,
+            notes=notes,
+            latest_work_order=latest_work_order,
+        )
+
+
+def _enc_hook(obj):
+    # Only reached for types msgspec cannot encode itself (Decimal, UUID,
+    # dataclasses and dates are native); fall back to Flask's rules.
+    return DefaultJSONProvider.default(obj)
+
+
+_encoder = msgspec.json.Encoder(enc_hook=_enc_hook)
+
+
+def encode(obj) -> bytes:
+    return _encoder.encode(obj)
+
+
+def encode_response(status: int = 200, **payload):
+    """Build a JSON response from Structs/dicts without an intermediate str."""
+    return current_app.response_class(encode(payload), status=status, mimetype="application/json")
+
+
+class MsgspecJSONProvider(DefaultJSONProvider):
+    """jsonify() and request.get_json() backed by msgspec.
+
+    Output stays compact and unsorted; key order follows the dicts and Struct
+    field order the views already produce.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return encode(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return msgspec.json.decode(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(encode(obj), mimetype=self.mimetype)
@@ -0,0 +1,191 @@
+import argparse
+import json
+import os
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, func, select, text
+
+SERVER_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SERVER_DIR))
+
+from app.models import (  # noqa: E402
+    Base,
+    EventEnum,
+    Machine,
+    MachineNote,
+    StatusEnum,
+    TechnicianDailyRollup,
+    WorkOrder,
+    WorkOrderEvent,
+)
+
+# users is a handful of rows; team metrics deliberately walks all of them.
+ALLOWED_FULL_SCANS = {"users"}
+
+
+def _samples(conn):
+    machine_id, serial = conn.execute(
+        select(Machine.id, Machine.serial).order_by(Machine.id.desc()).limit(1)
+    ).one()
+    technician_id = conn.execute(
+        select(WorkOrderEvent.technician_id).order_by(WorkOrderEvent.id.desc()).limit(1)
+    ).scalar_one()
+    work_order_id = conn.execute(select(func.max(WorkOrder.id))).scalar_one()
+    end = date.today()
+    return {
+        "machine_id": machine_id,
+        "serial": serial,
+        "technician_id": technician_id,
+        "work_order_id": work_order_id,
+        "start": end - timedelta(days=90),
+        "end": end,
+    }
+
+
+def hot_queries(s):
+    """The statements read.py, export.py, delete.py and the models issue on hot paths."""
+    machines_page = (
+        select(Machine, WorkOrder)
+        .outerjoin(WorkOrder, WorkOrder.id == Machine.latest_work_order_id)
+        .order_by(Machine.latest_work_order_id.desc(), Machine.id.desc())
+        .limit(25)
+    )
+    technician_events = [
+        WorkOrderEvent.technician_id == s["technician_id"],
+        WorkOrderEvent.event_date >= s["start"],
+        WorkOrderEvent.event_date <= s["end"],
+    ]
+    reopen_counts = (
+        select(WorkOrderEvent.work_order_id, func.count(WorkOrderEvent.id).label("reopens"))
+        .where(WorkOrderEvent.event_type == EventEnum.REOPENED)
+        .group_by(WorkOrderEvent.work_order_id)
+        .subquery()
+    )
+    return {
+        "get_machines": machines_page,
+        "get_machines.status": machines_page.where(Machine.current_status == StatusEnum.IN_PROGRESS),
+        "get_machines.user_id": machines_page.where(WorkOrder.initiated_by == s["technician_id"]),
+        "serial_search": select(Machine).where(Machine.serial == s["serial"]),
+        "get_machine.notes": select(MachineNote).where(MachineNote.machine_id.in_([s["machine_id"]])),
+        "machine_history.work_orders": select(WorkOrder)
+            .where(WorkOrder.machine_id == s["machine_id"])
+            .order_by(WorkOrder.initiated_on, WorkOrder.id),
+        "machine_history.events": select(WorkOrderEvent)
+            .where(WorkOrderEvent.machine_id == s["machine_id"])
+            .order_by(WorkOrderEvent.event_date, WorkOrderEvent.id),
+        "machine_history.notes": select(MachineNote)
+            .where(MachineNote.machine_id == s["machine_id"])
+            .order_by(MachineNote.added_on, MachineNote.id),
+        "refresh_latest_work_order": select(WorkOrder)
+            .where(WorkOrder.machine_id == s["machine_id"])
+            .order_by(WorkOrder.id.desc())
+            .limit(1),
+        "user_metrics.counts": select(WorkOrderEvent.event_type, func.count(WorkOrderEvent.id))
+            .where(*technician_events)
+            .group_by(WorkOrderEvent.event_type),
+        "user_metrics.events": select(WorkOrderEvent)
+            .where(*technician_events)
+            .order_by(WorkOrderEvent.event_date.desc(), WorkOrderEvent.id.desc())
+            .limit(100),
+        "user_metrics.rollup": select(TechnicianDailyRollup.event_type, func.sum(TechnicianDailyRollup.event_count))
+            .where(
+                TechnicianDailyRollup.technician_id == s["technician_id"],
+                TechnicianDailyRollup.event_date >= s["start"],
+                TechnicianDailyRollup.event_date <= s["end"],
+            )
+            .group_by(TechnicianDailyRollup.event_type),
+        "export_user_report": select(WorkOrderEvent)
+            .join(Machine, Machine.id == WorkOrderEvent.machine_id)
+            .where(*technician_events)
+            .order_by(WorkOrderEvent.event_date, WorkOrderEvent.id),
+        "delete_work_order.events": select(WorkOrderEvent).where(WorkOrderEvent.work_order_id == s["work_order_id"]),
+        "turnaround_analytics": select(
+                WorkOrder.initiated_by,
+                Machine.category,
+                WorkOrder.initiated_on,
+                WorkOrder.closed_on,
+                func.coalesce(reopen_counts.c.reopens, 0),
+            )
+            .join(Machine, Machine.id == WorkOrder.machine_id)
+            .outerjoin(reopen_counts, reopen_counts.c.work_order_id == WorkOrder.id)
+            .where(WorkOrder.closed_on.is_not(None), WorkOrder.closed_on >= s["start"], WorkOrder.closed_on <= s["end"]),
+    }
+
+
+def _full_scans_sqlite(conn, sql):
+    plan = [row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+    scans = []
+    for detail in plan:
+        # "SCAN t" is a table scan; "SCAN t USING [COVERING] INDEX ix" walks an index.
+        if detail.startswith("SCAN ") and " USING " not in detail:
+            scans.append(detail.split()[1])
+    return plan, scans
+
+
+def _full_scans_mysql(conn, sql):
+    rows = conn.execute(text(f"EXPLAIN {sql}")).mappings().all()
+    plan = [dict(row) for row in rows]
+    scans = [row["table"] for row in plan if row.get("type") == "ALL" and row.get("table")]
+    return plan, scans
+
+
+def check_query_plans(database_uri: str, analyze: bool = True):
+    engine = create_engine(database_uri)
+    dialect = engine.dialect.name
+    if dialect == "sqlite":
+        explain = _full_scans_sqlite
+    elif dialect in {"mysql", "mariadb"}:
+        explain = _full_scans_mysql
+    else:
+        raise SystemExit(f"Unsupported dialect for plan checks: {dialect}")
+
+    table_names = {table.name for table in Base.metadata.sorted_tables}
+    results = {}
+    failures = []
+
+    with engine.connect() as conn:
+        if analyze:
+            if dialect == "sqlite":
+                conn.execute(text("ANALYZE"))
+            else:
+                for name in table_names:
+                    conn.execute(text(f"ANALYZE TABLE {name}"))
+            conn.commit()
+
+        samples = _samples(conn)
+        for name, statement in hot_queries(samples).items():
+            sql = str(statement.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+            plan, scans = explain(conn, sql)
+            # Derived tables and subquery materializations are not base tables.
+            scans = sorted({t for t in scans if t in table_names and t not in ALLOWED_FULL_SCANS})
+            results[name] = {"full_scans": scans, "plan": plan}
+            if scans:
+                failures.append(name)
+
+    return {"dialect": dialect, "samples": {k: str(v) for k, v in samples.items()}, "failures": failures, "queries": results}
+
+
+def main():
+    load_dotenv(SERVER_DIR / ".env")
+    parser = argparse.ArgumentParser(
+        description="EXPLAIN each hot query against a seeded database and fail if any falls back to a full table scan."
+    )
+    parser.add_argument(
+        "--database-uri",
+        default=os.getenv("LOADTEST_DATABASE_URI", f"sqlite:///{SERVER_DIR / 'benchmarks' / 'loadtest.db'}"),
+        help="Seeded DB URI (see benchmarks/load_test.py seed). Defaults to LOADTEST_DATABASE_URI or benchmarks/loadtest.db.",
+    )
+    parser.add_argument("--skip-analyze", action="store_true", help="Do not refresh planner statistics first.")
+    args = parser.parse_args()
+
+    result = check_query_plans(args.database_uri, analyze=not args.skip_analyze)
+    print(json.dumps(result, indent=2, default=str))
+    if result["failures"]:
+        raise SystemExit(f"Full table scans in: {', '.join(result['failures'])}")
+
+
+if __name__ == "__main__":
+    main()
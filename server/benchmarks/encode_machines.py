@@ -0,0 +1,106 @@
+import argparse
+import json
+import sys
+import timeit
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from flask import Flask  # noqa: E402
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
+
+from app.models import Machine, User, WorkOrder  # noqa: E402
+from app.models.enums import CategoryEnum, ConditionEnum, StatusEnum, VendorEnum  # noqa: E402
+from app.schemas import MachineSchema, MsgspecJSONProvider  # noqa: E402
+
+
+def _build_rows(count: int):
+    """Transient (unsessioned) machines shaped like a /machines page row."""
+    technicians = [
+        User(id=i, first_name=f"Tech{i}", last_name="Bench", email=f"tech{i}@bench", password_hash="x")
+        for i in range(1, 11)
+    ]
+    categories = list(CategoryEnum)
+    statuses = [StatusEnum.IN_PROGRESS, StatusEnum.COMPLETED, StatusEnum.TRASHED, StatusEnum.ARCHIVED]
+    start = date(2025, 1, 1)
+
+    rows = []
+    for i in range(1, count + 1):
+        status = statuses[i % len(statuses)]
+        machine = Machine(
+            id=i,
+            brand="whirlpool",
+            model=f"WTW{5000 + i}",
+            serial=f"BENCH{i:08d}",
+            category=categories[i % len(categories)],
+            form_factor="top load",
+            color="white",
+            condition=ConditionEnum.USED,
+            vendor=VendorEnum.UNKNOWN,
+            current_status=status,
+        )
+        work_order = WorkOrder(
+            id=i,
+            machine_id=i,
+            initiated_on=start + timedelta(days=i % 365),
+            initiated_by=technicians[i % 10].id,
+            current_status=status,
+            closed_on=start + timedelta(days=i % 365 + 3) if status != StatusEnum.IN_PROGRESS else None,
+            archived_on=None,
+        )
+        work_order.initiator = technicians[i % 10]
+        rows.append((machine, work_order))
+    return rows
+
+
+def _dict_payload(machine, work_order):
+    # The pre-msgspec _build_machine_payload.
+    payload = machine.serialize()
+    payload["latest_work_order"] = work_order.serialize() if work_order else None
+    return payload
+
+
+def run_benchmark(rows: int, repeat: int, number: int):
+    app = Flask(__name__)
+    stdlib_provider = DefaultJSONProvider(app)
+    msgspec_provider = MsgspecJSONProvider(app)
+    data = _build_rows(rows)
+
+    cases = {
+        "stdlib_json": lambda: stdlib_provider.response(
+            success=True, machines=[_dict_payload(m, wo) for m, wo in data]
+        ).get_data(),
+        "msgspec_struct": lambda: msgspec_provider.response(
+            success=True, machines=[MachineSchema.from_model(m, wo) for m, wo in data]
+        ).get_data(),
+    }
+
+    results = {}
+    with app.app_context():
+        for name, case in cases.items():
+            best = min(timeit.repeat(case, repeat=repeat, number=number)) / number
+            results[name] = {
+                "page_ms": round(best * 1000, 3),
+                "per_row_us": round(best / rows * 1_000_000, 3),
+                "bytes": len(case()),
+            }
+
+    results["speedup"] = round(results["stdlib_json"]["page_ms"] / results["msgspec_struct"]["page_ms"], 2)
+    return {"rows": rows, "repeat": repeat, "number": number, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare per-row encode cost of the machines list: serialize()+stdlib json vs msgspec Structs."
+    )
+    parser.add_argument("--rows", type=int, default=500, help="Machines per encoded page.")
+    parser.add_argument("--repeat", type=int, default=5, help="timeit repeats; the best run is reported.")
+    parser.add_argument("--number", type=int, default=20, help="Encodes per repeat.")
+    args = parser.parse_args()
+
+    print(json.dumps(run_benchmark(args.rows, args.repeat, args.number), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+
+import bcrypt
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, insert
+
+SERVER_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SERVER_DIR))
+
+from app.models import (  # noqa: E402
+    Base,
+    CategoryEnum,
+    ConditionEnum,
+    EventEnum,
+    EventReasonEnum,
+    Machine,
+    MachineNote,
+    RoleEnum,
+    StatusEnum,
+    User,
+    VendorEnum,
+    WorkOrder,
+    WorkOrderEvent,
+)
+from rebuild_derived_data import rebuild_derived_data  # noqa: E402
+from seed_legacy_rehearsal import BRANDS, COLORS, STYLES  # noqa: E402
+
+
+SCALES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+BATCH_SIZE = 5000
+PASSWORD = "loadtest"
+
+OUTCOMES = ["in_progress", "completed", "trashed", "archived"]
+OUTCOME_WEIGHTS = [35, 30, 15, 20]
+NOTE_WORDS = ["compressor", "relay", "door", "seal", "pump", "belt", "igniter", "thermostat", "leak", "noise", "dent", "scratch"]
+
+# name -> (weight in the default mix, method)
+ROUTES = {
+    "get_machines": (30, "GET"),
+    "get_machine": (20, "GET"),
+    "serial_search": (20, "GET"),
+    "user_metrics": (10, "GET"),
+    "update_work_order_status": (10, "PATCH"),
+    "export_user_report": (5, "GET"),
+}
+
+
+def _serial(machine_id: int) -> str:
+    return f"LT{machine_id:08d}"
+
+
+def _event(event_id, work_order_id, machine_id, event_type, from_status, to_status, event_date, technician_id, reason=EventReasonEnum.DEFAULT):
+    return {
+        "id": event_id,
+        "work_order_id": work_order_id,
+        "machine_id": machine_id,
+        "event_type": event_type,
+        "from_status": from_status,
+        "to_status": to_status,
+        "event_date": event_date,
+        "technician_id": technician_id,
+        "reason": reason,
+    }
+
+
+def _machine_batch(rng, start_id, end_id, user_count, today, ids):
+    machines, work_orders, events, notes = [], [], [], []
+    categories = list(CategoryEnum)
+    vendors = list(VendorEnum)
+
+    for machine_id in range(start_id, end_id):
+        technician_id = rng.randint(1, user_count)
+        initiated_on = today - timedelta(days=rng.randint(1, 730))
+        outcome = rng.choices(OUTCOMES, weights=OUTCOME_WEIGHTS, k=1)[0]
+        work_order_id = machine_id
+
+        machines.append(
+            {
+                "id": machine_id,
+                "brand": rng.choice(BRANDS).lower(),
+                "model": f"MDL{rng.randint(1000, 9999)}",
+                "serial": _serial(machine_id),
+                "category": rng.choice(categories),
+                "form_factor": rng.choice(STYLES),
+                "color": rng.choice(COLORS),
+                "condition": rng.choices(list(ConditionEnum), weights=[20, 60, 20], k=1)[0],
+                "vendor": rng.choice(vendors),
+            }
+        )
+
+        day = initiated_on
+        events.append(_event(ids["event"], work_order_id, machine_id, EventEnum.INITIATED, None, StatusEnum.IN_PROGRESS, day, technician_id))
+        ids["event"] += 1
+
+        closed_on = archived_on = None
+        status = StatusEnum.IN_PROGRESS
+        if outcome != "in_progress":
+            # Roughly one in twelve closed machines comes back on warranty/return first.
+            if rng.random() < 0.08:
+                day += timedelta(days=rng.randint(1, 20))
+                events.append(_event(ids["event"], work_order_id, machine_id, EventEnum.COMPLETED, StatusEnum.IN_PROGRESS, StatusEnum.COMPLETED, day, technician_id))
+                day += timedelta(days=rng.randint(1, 30))
+                reason = rng.choice([EventReasonEnum.WARRANTY, EventReasonEnum.RETURN])
+                events.append(_event(ids["event"] + 1, work_order_id, machine_id, EventEnum.REOPENED, StatusEnum.COMPLETED, StatusEnum.IN_PROGRESS, day, technician_id, reason))
+                ids["event"] += 2
+
+            day += timedelta(days=rng.randint(1, 30))
+            closing = StatusEnum.TRASHED if outcome == "trashed" else StatusEnum.COMPLETED
+            closing_event = EventEnum.TRASHED if outcome == "trashed" else EventEnum.COMPLETED
+            events.append(_event(ids["event"], work_order_id, machine_id, closing_event, StatusEnum.IN_PROGRESS, closing, day, technician_id))
+            ids["event"] += 1
+            closed_on, status = day, closing
+
+            if outcome == "archived":
+                day += timedelta(days=rng.randint(1, 30))
+                events.append(_event(ids["event"], work_order_id, machine_id, EventEnum.ARCHIVED, StatusEnum.COMPLETED, StatusEnum.ARCHIVED, day, technician_id))
+                ids["event"] += 1
+                archived_on, status = day, StatusEnum.ARCHIVED
+
+        work_orders.append(
+            {
+                "id": work_order_id,
+                "machine_id": machine_id,
+                "initiated_on": initiated_on,
+                "initiated_by": technician_id,
+                "current_status": status,
+                "closed_on": closed_on,
+                "archived_on": archived_on,
+            }
+        )
+
+        for _ in range(rng.randint(0, 2)):
+            notes.append(
+                {
+                    "id": ids["note"],
+                    "content": " ".join(rng.sample(NOTE_WORDS, k=rng.randint(2, 5))),
+                    "added_on": initiated_on + timedelta(days=rng.randint(0, 10)),
+                    "technician_id": technician_id,
+                    "machine_id": machine_id,
+                }
+            )
+            ids["note"] += 1
+
+    return machines, work_orders, events, notes
+
+
+def seed_load_test(database_uri: str, machine_count: int, user_count: int = 12, seed: int = 42):
+    rng = random.Random(seed)
+    engine = create_engine(database_uri)
+    # Recreate rather than create_all + DELETE so a reused DB picks up new indexes.
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    # Low bcrypt cost so logging in a few hundred workers is not the bottleneck.
+    password_hash = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt(rounds=4)).decode("utf-8")
+    today = date.today()
+    counts = Counter()
+
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User.__table__),
+            [
+                {
+                    "id": i,
+                    "first_name": f"Load{i}",
+                    "last_name": "Tester",
+                    "email": f"load{i}@example.local",
+                    "password_hash": password_hash,
+                    "role": RoleEnum.ADMIN if i == 1 else RoleEnum.TECHNICIAN,
+                }
+                for i in range(1, user_count + 1)
+            ],
+        )
+        counts["users"] = user_count
+
+    ids = {"event": 1, "note": 1}
+    for start in range(1, machine_count + 1, BATCH_SIZE):
+        end = min(start + BATCH_SIZE, machine_count + 1)
+        machines, work_orders, events, notes = _machine_batch(rng, start, end, user_count, today, ids)
+        with engine.begin() as conn:
+            conn.execute(insert(Machine.__table__), machines)
+            conn.execute(insert(WorkOrder.__table__), work_orders)
+            conn.execute(insert(WorkOrderEvent.__table__), events)
+            if notes:
+                conn.execute(insert(MachineNote.__table__), notes)
+        counts["machines"] += len(machines)
+        counts["work_orders"] += len(work_orders)
+        counts["work_order_events"] += len(events)
+        counts["machine_notes"] += len(notes)
+
+    derived = rebuild_derived_data(database_uri)
+    return {"database_uri": database_uri, "seed": seed, "counts": dict(counts), "derived": derived}
+
+
+class InProcessClient:
+    def __init__(self, app):
+        self._client = app.test_client()
+
+    def request(self, method, path, json_body=None):
+        response = self._client.open(path, method=method, json=json_body)
+        response.close()
+        return response.status_code
+
+
+class HttpClient:
+    def __init__(self, base_url):
+        import requests
+
+        self._base_url = base_url.rstrip("/")
+        self._session = requests.Session()
+
+    def request(self, method, path, json_body=None):
+        return self._session.request(method, self._base_url + path, json=json_body).status_code
+
+
+def _route_request(name, rng, machine_count, user_count, today):
+    machine_id = rng.randint(1, machine_count)
+    user_id = rng.randint(1, user_count)
+    if name == "get_machines":
+        status = rng.choice(["", "&status=in_progress", "&status=completed"])
+        return "GET", f"/api/read/machines?page={rng.randint(1, 20)}&per_page=25{status}", None
+    if name == "get_machine":
+        return "GET", f"/api/read/machine/{machine_id}", None
+    if name == "serial_search":
+        return "GET", f"/api/read/serial/{_serial(machine_id)}", None
+    if name == "user_metrics":
+        start = today - timedelta(days=rng.choice([30, 90, 365]))
+        return "GET", f"/api/read/metrics/{user_id}?start_date={start:%Y-%m-%d}&end_date={today:%Y-%m-%d}", None
+    if name == "update_work_order_status":
+        status = rng.choice(["in_progress", "completed"])
+        return "PATCH", f"/api/update/work_order/{machine_id}/status", {"new_status": status}
+    if name == "export_user_report":
+        start = today - timedelta(days=90)
+        return "GET", f"/api/export/user_report/{user_id}?format=csv&start={start:%Y-%m-%d}&end={today:%Y-%m-%d}", None
+    raise ValueError(name)
+
+
+def _percentiles(samples):
+    if not samples:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    p50, p95, p99 = np.percentile(np.asarray(samples) * 1000, [50, 95, 99])
+    return {
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "max_ms": round(max(samples) * 1000, 3),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=SERVER_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_load_test(make_client, routes, machine_count, user_count, concurrency, duration, warmup, seed):
+    today = date.today()
+    weights = [ROUTES[name][0] for name in routes]
+    lock = threading.Lock()
+    latencies = {name: [] for name in routes}
+    statuses = {name: Counter() for name in routes}
+
+    def worker(index):
+        rng = random.Random(seed + index)
+        client = make_client()
+        status = client.request("POST", "/api/auth/login", {"email": "load1@example.local", "password": PASSWORD})
+        if status != 200:
+            raise RuntimeError(f"Login failed with status {status}")
+
+        local_latencies = {name: [] for name in routes}
+        local_statuses = {name: Counter() for name in routes}
+        warm_until = time.monotonic() + warmup
+        stop_at = warm_until + duration
+        while True:
+            now = time.monotonic()
+            if now >= stop_at:
+                break
+            name = rng.choices(routes, weights=weights, k=1)[0]
+            method, path, body = _route_request(name, rng, machine_count, user_count, today)
+            start = time.perf_counter()
+            status = client.request(method, path, body)
+            elapsed = time.perf_counter() - start
+            if now >= warm_until:
+                local_latencies[name].append(elapsed)
+                local_statuses[name][status] += 1
+
+        with lock:
+            for name in routes:
+                latencies[name].extend(local_latencies[name])
+                statuses[name].update(local_statuses[name])
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker, i) for i in range(concurrency)]:
+            future.result()
+
+    report = {}
+    total = 0
+    for name in routes:
+        samples = latencies[name]
+        errors = sum(n for code, n in statuses[name].items() if code >= 500)
+        total += len(samples)
+        report[name] = {
+            "requests": len(samples),
+            "errors": errors,
+            "throughput_rps": round(len(samples) / duration, 2),
+            **_percentiles(samples),
+            "status_codes": {str(code): n for code, n in sorted(statuses[name].items())},
+        }
+
+    return {
+        "commit": _git_commit(),
+        "concurrency": concurrency,
+        "duration_s": duration,
+        "total_requests": total,
+        "throughput_rps": round(total / duration, 2),
+        "routes": report,
+    }
+
+
+def _in_process_client_factory(database_uri):
+    from config import Config
+    from app import create_app
+
+    class LoadTestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = database_uri
+        QUERY_STATS_HEADERS = False
+
+    app = create_app(LoadTestConfig)
+    return lambda: InProcessClient(app)
+
+
+def main():
+    load_dotenv(SERVER_DIR / ".env")
+    parser = argparse.ArgumentParser(
+        description="Seed a load-test database and drive concurrent traffic at the main API routes, reporting throughput and latency percentiles as JSON."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = sub.add_parser("seed", help="Create the schema and seed synthetic data at the chosen scale.")
+    seed_parser.add_argument(
+        "--database-uri",
+        default=os.getenv("LOADTEST_DATABASE_URI", f"sqlite:///{SERVER_DIR / 'benchmarks' / 'loadtest.db'}"),
+        help="Target DB URI (local MySQL or SQLite). Defaults to LOADTEST_DATABASE_URI or benchmarks/loadtest.db. Existing tables are dropped and recreated.",
+    )
+    seed_parser.add_argument("--scale", choices=list(SCALES), default="10k", help="Machine count preset.")
+    seed_parser.add_argument("--machines", type=int, help="Exact machine count; overrides --scale.")
+    seed_parser.add_argument("--users", type=int, default=12, help="Number of technicians to generate.")
+    seed_parser.add_argument("--seed", type=int, default=42, help="Random seed for deterministic data generation.")
+
+    run_parser = sub.add_parser("run", help="Drive traffic against a seeded database.")
+    target = run_parser.add_mutually_exclusive_group()
+    target.add_argument(
+        "--database-uri",
+        default=os.getenv("LOADTEST_DATABASE_URI", f"sqlite:///{SERVER_DIR / 'benchmarks' / 'loadtest.db'}"),
+        help="Serve requests in-process with the Flask test client against this DB. Sessions and cache use REDIS_URL as in production.",
+    )
+    target.add_argument("--base-url", help="Send HTTP requests to a running server instead, e.g. http://127.0.0.1:8000.")
+    run_parser.add_argument("--machines", type=int, default=SCALES["10k"], help="Machine count the database was seeded with.")
+    run_parser.add_argument("--users", type=int, default=12, help="User count the database was seeded with.")
+    run_parser.add_argument("--concurrency", type=int, default=8, help="Concurrent client threads.")
+    run_parser.add_argument("--duration", type=float, default=30, help="Measured seconds per run.")
+    run_parser.add_argument("--warmup", type=float, default=3, help="Unmeasured seconds before measuring.")
+    run_parser.add_argument("--route", action="append", choices=list(ROUTES), help="Limit traffic to a route. Repeatable.")
+    run_parser.add_argument("--seed", type=int, default=42, help="Random seed for request selection.")
+    run_parser.add_argument("--output", help="Also write the JSON report to this file.")
+
+    args = parser.parse_args()
+
+    if args.command == "seed":
+        result = seed_load_test(args.database_uri, args.machines or SCALES[args.scale], args.users, args.seed)
+        print(json.dumps(result, indent=2))
+        return
+
+    if args.base_url:
+        make_client = lambda: HttpClient(args.base_url)  # noqa: E731
+    else:
+        make_client = _in_process_client_factory(args.database_uri)
+
+    result = run_load_test(
+        make_client,
+        args.route or list(ROUTES),
+        args.machines,
+        args.users,
+        args.concurrency,
+        args.duration,
+        args.warmup,
+        args.seed,
+    )
+    result["target"] = args.base_url or args.database_uri
+    output = json.dumps(result, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import timeit
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+
+SERVER_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SERVER_DIR))
+
+import format_legacy_data as legacy  # noqa: E402
+from app.api.export import generate_user_report_csv  # noqa: E402
+from app.api.read import _build_machine_payload  # noqa: E402
+from app.models import (  # noqa: E402
+    CategoryEnum,
+    ConditionEnum,
+    EventEnum,
+    EventReasonEnum,
+    Machine,
+    MachineNote,
+    RoleEnum,
+    StatusEnum,
+    User,
+    VendorEnum,
+    WorkOrder,
+    WorkOrderEvent,
+)
+from seed_legacy_rehearsal import BRANDS, COLORS, CONDITIONS, LEGACY_ROLES, STATUSES, STYLES, TYPES, VENDORS  # noqa: E402
+
+
+DEFAULT_SIZES = (100, 1000, 10000)
+DEFAULT_BASELINE = SERVER_DIR / "benchmarks" / "baselines" / "microbench.json"
+DEFAULT_THRESHOLD = 0.20
+REPEAT = 7
+
+
+# --------------------
+#    FIXTURES
+# --------------------
+@lru_cache(maxsize=None)
+def _model_rows(size: int, seed: int = 42):
+    """Transient (unsessioned) model graphs: users, machines with one work order,
+    two events and a note each, wired the way the ORM would load them."""
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    users = [
+        User(id=i, first_name=f"Tech{i}", last_name="Bench", email=f"tech{i}@bench", password_hash="x",
+             role=RoleEnum.ADMIN if i == 1 else RoleEnum.TECHNICIAN)
+        for i in range(1, 13)
+    ]
+    machines, work_orders, events, notes = [], [], [], []
+    for i in range(1, size + 1):
+        tech = rng.choice(users)
+        day = start + timedelta(days=rng.randint(0, 365))
+        machine = Machine(
+            id=i, brand=rng.choice(BRANDS).lower(), model=f"MDL{rng.randint(1000, 9999)}", serial=f"BENCH{i:08d}",
+            category=rng.choice(list(CategoryEnum)), form_factor=rng.choice(STYLES), color=rng.choice(COLORS),
+            condition=rng.choice(list(ConditionEnum)), vendor=rng.choice(list(VendorEnum)),
+            current_status=StatusEnum.COMPLETED,
+        )
+        work_order = WorkOrder(
+            id=i, machine_id=i, initiated_on=day, initiated_by=tech.id,
+            current_status=StatusEnum.COMPLETED, closed_on=day + timedelta(days=3), archived_on=None,
+        )
+        work_order.initiator = tech
+        note = MachineNote(id=i, content=f"bench note {i} replaced relay", added_on=day, technician_id=tech.id, machine_id=i)
+        note.technician = tech
+        machine.notes = [note]
+        for offset, (event_type, from_status, to_status) in enumerate([
+            (EventEnum.INITIATED, None, StatusEnum.IN_PROGRESS),
+            (EventEnum.COMPLETED, StatusEnum.IN_PROGRESS, StatusEnum.COMPLETED),
+        ]):
+            events.append(WorkOrderEvent(
+                id=2 * i + offset, work_order_id=i, machine_id=i, event_type=event_type, from_status=from_status,
+                to_status=to_status, event_date=day + timedelta(days=3 * offset), technician_id=tech.id,
+                reason=EventReasonEnum.DEFAULT,
+            ))
+        machines.append(machine)
+        work_orders.append(work_order)
+        notes.append(note)
+    return {"users": users, "machines": machines, "work_orders": work_orders, "events": events, "notes": notes}
+
+
+def _report(size: int, seed: int = 42):
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    return {
+        "user": {"id": 1, "name": "Tech1 Bench"},
+        "summary": {},
+        "rows": [
+            {
+                "brand": rng.choice(BRANDS).lower(),
+                "machine_type": rng.choice(list(CategoryEnum)).value,
+                "machine_style": rng.choice(STYLES),
+                "status": rng.choice(list(EventEnum)).value,
+                "date": (start + timedelta(days=rng.randint(0, 365))).isoformat(),
+            }
+            for _ in range(size)
+        ],
+    }
+
+
+@lru_cache(maxsize=None)
+def _legacy_rows(size: int, seed: int = 42):
+    """In-memory rows in the legacy schema, distributed like seed_legacy_rehearsal."""
+    rng = random.Random(seed)
+    today = date(2026, 1, 1)
+    users = [
+        {"id": i, "first_name": f"Tech{i}", "last_name": "User", "role": LEGACY_ROLES[(i - 1) % len(LEGACY_ROLES)],
+         "is_admin": i == 1, "email": f"tech{i}@example.local", "password_hash": "x"}
+        for i in range(1, 13)
+    ]
+    machines, notes, history = [], [], []
+    for i in range(1, size + 1):
+        tech_id = rng.randint(1, len(users))
+        started_on = today - timedelta(days=rng.randint(30, 365))
+        status = rng.choices(STATUSES, weights=[35, 30, 20, 10, 5], k=1)[0]
+        closed_on = started_on + timedelta(days=rng.randint(1, 30)) if status != "in_progress" else None
+        exported_on = closed_on + timedelta(days=rng.randint(1, 30)) if status in {"archived", "exported"} else None
+        machines.append({
+            "id": i, "brand": rng.choice(BRANDS), "type_of": rng.choice(TYPES), "model": f"MODEL-{rng.randint(1000, 9999)}",
+            "serial": f"SER-{i:06d}", "style": rng.choice(STYLES), "color": rng.choice(COLORS),
+            "condition": rng.choice(CONDITIONS), "vendor": rng.choice(VENDORS), "status": status,
+            "started_on": started_on, "completed_on": closed_on if status != "trashed" else None,
+            "trashed_on": closed_on if status == "trashed" else None, "exported_on": exported_on,
+            "technician_id": tech_id,
+        })
+        if closed_on:
+            history.append({"id": len(history) + 1, "machine_id": i, "status": "trashed" if status == "trashed" else "completed",
+                            "prev_status": "in_progress", "changed_on": closed_on, "changed_by": tech_id})
+        if exported_on:
+            history.append({"id": len(history) + 1, "machine_id": i, "status": "archived", "prev_status": "completed",
+                            "changed_on": exported_on, "changed_by": tech_id})
+        for _ in range(rng.randint(0, 2)):
+            notes.append({"id": len(notes) + 1, "content": f"Legacy note for machine {i}", "date": started_on,
+                          "user_id": tech_id, "machine_id": i})
+    return {"users": users, "machines": machines, "notes": notes, "history": history}
+
+
+# --------------------
+#    CASES
+# --------------------
+# Each case takes a size and returns a zero-argument callable to time; setup
+# (fixture building) happens outside the timed region.
+def _serialize_case(kind):
+    def setup(size):
+        rows = _model_rows(size)[kind]
+        return lambda: [row.serialize() for row in rows]
+    return setup
+
+
+def _build_machine_payload_case(size):
+    rows = _model_rows(size)
+    pairs = list(zip(rows["machines"], rows["work_orders"]))
+    return lambda: [_build_machine_payload(machine, work_order) for machine, work_order in pairs]
+
+
+def _user_report_csv_case(size):
+    report = _report(size)
+    return lambda: generate_user_report_csv(report).get_data()
+
+
+def _legacy_case(step):
+    def setup(size):
+        rows = _legacy_rows(size)
+        user_ids = {u["id"] for u in rows["users"]}
+        work_orders, _ = legacy._transform_work_orders(rows["machines"], user_ids)
+        steps = {
+            "users": lambda: legacy._transform_users(rows["users"]),
+            "machines": lambda: legacy._transform_machines(rows["machines"]),
+            "work_orders": lambda: legacy._transform_work_orders(rows["machines"], user_ids),
+            "work_order_events": lambda: legacy._transform_work_order_events(
+                rows["machines"], rows["history"], work_orders, user_ids
+            ),
+            "notes": lambda: legacy._transform_notes(rows["notes"], rows["machines"], user_ids),
+        }
+        return steps[step]
+    return setup
+
+
+CASES = {
+    "serialize.user": _serialize_case("users"),
+    "serialize.machine": _serialize_case("machines"),
+    "serialize.work_order": _serialize_case("work_orders"),
+    "serialize.work_order_event": _serialize_case("events"),
+    "serialize.machine_note": _serialize_case("notes"),
+    "read.build_machine_payload": _build_machine_payload_case,
+    "export.generate_user_report_csv": _user_report_csv_case,
+    "legacy.transform_users": _legacy_case("users"),
+    "legacy.transform_machines": _legacy_case("machines"),
+    "legacy.transform_work_orders": _legacy_case("work_orders"),
+    "legacy.transform_work_order_events": _legacy_case("work_order_events"),
+    "legacy.transform_notes": _legacy_case("notes"),
+}
+# The user fixture is a fixed pool of technicians regardless of size.
+FIXED_SIZE_CASES = {"serialize.user", "legacy.transform_users"}
+
+
+# --------------------
+#    RUNNER
+# --------------------
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=SERVER_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes, selected=None):
+    results = {}
+    for name, setup in CASES.items():
+        if selected and not any(name.startswith(prefix) for prefix in selected):
+            continue
+        for size in (sizes[:1] if name in FIXED_SIZE_CASES else sizes):
+            fn = setup(size)
+            timer = timeit.Timer(fn)
+            number, _ = timer.autorange()
+            best = min(timer.repeat(repeat=REPEAT, number=number)) / number
+            results[f"{name}[{size}]"] = {
+                "seconds": best,
+                "per_item_us": round(best / size * 1_000_000, 4),
+                "loops": number,
+            }
+            print(f"{name}[{size}]: {best * 1000:.3f} ms", file=sys.stderr)
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": list(sizes),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float):
+    rows = {}
+    regressions = []
+    for key, entry in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            rows[key] = {"baseline_s": None, "current_s": entry["seconds"], "change": None}
+            continue
+        change = (entry["seconds"] - base["seconds"]) / base["seconds"]
+        rows[key] = {"baseline_s": base["seconds"], "current_s": entry["seconds"], "change": round(change, 4)}
+        if change > threshold:
+            regressions.append(key)
+    return {
+        "baseline_commit": baseline["meta"].get("commit"),
+        "current_commit": current["meta"].get("commit"),
+        "threshold": threshold,
+        "regressions": regressions,
+        "cases": rows,
+    }
+
+
+def _parse_sizes(raw: str):
+    return tuple(int(part) for part in raw.split(",") if part.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmarks for model serializers, report CSV generation and legacy migration transforms."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run the suite and print (or save) results as JSON.")
+    run_parser.add_argument("--sizes", type=_parse_sizes, default=DEFAULT_SIZES, help="Comma-separated fixture sizes.")
+    run_parser.add_argument("--case", action="append", help="Only run cases whose name starts with this. Repeatable.")
+    run_parser.add_argument("--save", nargs="?", const=str(DEFAULT_BASELINE), help="Write results as a baseline file.")
+
+    compare_parser = sub.add_parser("compare", help="Run the suite (or load --current) and diff against a baseline.")
+    compare_parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON written by run --save.")
+    compare_parser.add_argument("--current", help="Results JSON to compare instead of running the suite now.")
+    compare_parser.add_argument("--case", action="append", help="Only run cases whose name starts with this. Repeatable.")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="Relative slowdown that counts as a regression."
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        result = run_benchmarks(args.sizes, args.case)
+        if args.save:
+            path = Path(args.save)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(json.dumps(result, indent=2))
+        return
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    if args.current:
+        current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+    else:
+        current = run_benchmarks(tuple(baseline["meta"]["sizes"]), args.case)
+    report = compare(baseline, current, args.threshold)
+    print(json.dumps(report, indent=2))
+    if report["regressions"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,33 @@ class Config:
     SESSION_KEY_PREFIX = "blu:"
     PERMANENT_SESSION_LIFETIME = timedelta(days=7)
 
+    # Cache (shares the session Redis)
+    CACHE_ENABLED = environ.get("CACHE_ENABLED", "true").lower() == "true"
+    CACHE_REDIS = SESSION_REDIS
+    CACHE_KEY_PREFIX = "blu:cache:"
+    CACHE_DEFAULT_TIMEOUT = 300
+
+    # Live status stream ("redis" fans out across workers, "local" is in-process)
+    PUBSUB_BACKEND = environ.get("PUBSUB_BACKEND", "redis")
+    PUBSUB_REDIS = SESSION_REDIS
+    PUBSUB_CHANNEL = "blu:status"
+    STREAM_HEARTBEAT_SECONDS = 15
+
+    # /api/read/changes only reads past ids that have been visible this long
+    CHANGE_FEED_COMMIT_LAG_SECONDS = 2
+
+    # Query instrumentation (X-Query-* headers default to on in development)
+    QUERY_INSTRUMENTATION_ENABLED = environ.get("QUERY_INSTRUMENTATION_ENABLED", "true").lower() == "true"
+    QUERY_STATS_HEADERS = DEBUG
+    QUERY_REPEAT_WARN_THRESHOLD = 10
+
+    # Prometheus (set PROMETHEUS_MULTIPROC_DIR in the environment under gunicorn)
+    PROMETHEUS_ENABLED = environ.get("PROMETHEUS_ENABLED", "true").lower() == "true"
+
+    # Admin ?__profile=1 request profiler
+    PROFILE_DIR = environ.get("PROFILE_DIR")
+    PROFILE_SAMPLE_INTERVAL = 0.001
+
     # CORS
     if FLASK_ENV == "production":
         CORS_ORIGINS = ["https://blutape.net"]
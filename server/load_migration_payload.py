@@ -4,7 +4,7 @@ import os
 from pathlib import Path
 
 from dotenv import load_dotenv
-from sqlalchemy import MetaData, Table, create_engine, delete, insert
+from sqlalchemy import MetaData, Table, create_engine, delete, insert, inspect
 
 
 TABLE_ORDER = [
@@ -15,6 +15,15 @@ TABLE_ORDER = [
     "machine_notes",
 ]
 
+# Tables rebuilt after the load (rebuild_derived_data.py) or written only by the
+# new app. They hold FKs into TABLE_ORDER, so clear_first must empty them first.
+DEPENDENT_TABLES = [
+    "machine_search_grams",
+    "machine_note_tokens",
+    "technician_daily_rollups",
+    "machine_edits",
+]
+
 
 def _read_rows(input_dir: Path, table_name: str):
     path = input_dir / f"{table_name}.json"
@@ -27,10 +36,10 @@ def _read_rows(input_dir: Path, table_name: str):
     return payload
 
 
-def _load_tables(engine):
+def _load_tables(engine, names):
     metadata = MetaData()
     tables = {}
-    for name in TABLE_ORDER:
+    for name in names:
         tables[name] = Table(name, metadata, autoload_with=engine)
     return tables
 
@@ -38,7 +47,7 @@ def _load_tables(engine):
 def load_payload(database_uri: str, input_dir: str, dry_run: bool = False, clear_first: bool = False):
     engine = create_engine(database_uri)
     input_path = Path(input_dir)
-    tables = _load_tables(engine)
+    tables = _load_tables(engine, TABLE_ORDER)
     payloads = {name: _read_rows(input_path, name) for name in TABLE_ORDER}
 
     summary = {
@@ -53,6 +62,10 @@ def load_payload(database_uri: str, input_dir: str, dry_run: bool = False, clear
 
     with engine.begin() as conn:
         if clear_first:
+            present = [name for name in DEPENDENT_TABLES if inspect(conn).has_table(name)]
+            dependent = _load_tables(conn, present)
+            for name in present:
+                conn.execute(delete(dependent[name]))
             for name in reversed(TABLE_ORDER):
                 conn.execute(delete(tables[name]))
 
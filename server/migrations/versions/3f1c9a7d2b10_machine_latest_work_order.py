@@ -0,0 +1,52 @@
+"""denormalize latest work order pointer and status onto machines
+
+Revision ID: 3f1c9a7d2b10
+Revises: 
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9a7d2b10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+STATUS_VALUES = ("in_progress", "completed", "trashed", "archived")
+
+
+def upgrade():
+    with op.batch_alter_table('machines', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('latest_work_order_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column(
+            'current_status',
+            sa.Enum(*STATUS_VALUES, name='status_enum', native_enum=False, length=11),
+            nullable=True,
+        ))
+        batch_op.create_index('ix_machines_latest_work_order_id', ['latest_work_order_id'], unique=False)
+        batch_op.create_index(
+            'ix_machines_current_status_latest_work_order_id',
+            ['current_status', 'latest_work_order_id'],
+            unique=False,
+        )
+
+    op.execute(
+        "UPDATE machines SET latest_work_order_id = "
+        "(SELECT MAX(work_orders.id) FROM work_orders WHERE work_orders.machine_id = machines.id)"
+    )
+    op.execute(
+        "UPDATE machines SET current_status = "
+        "(SELECT work_orders.current_status FROM work_orders WHERE work_orders.id = machines.latest_work_order_id)"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('machines', schema=None) as batch_op:
+        batch_op.drop_index('ix_machines_current_status_latest_work_order_id')
+        batch_op.drop_index('ix_machines_latest_work_order_id')
+        batch_op.drop_column('current_status')
+        batch_op.drop_column('latest_work_order_id')
@@ -0,0 +1,46 @@
+"""add machine_search_grams trigram table for serial/model fragment search
+
+Populate existing machines afterwards with:
+    python rebuild_derived_data.py --only search_grams
+
+Revision ID: 8b2e4f6a1c37
+Revises: 3f1c9a7d2b10
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e4f6a1c37'
+down_revision = '3f1c9a7d2b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'machine_search_grams',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('machine_id', sa.Integer(), nullable=False),
+        sa.Column('field', sa.String(length=10), nullable=False),
+        sa.Column('gram', sa.String(length=3), nullable=False),
+        sa.ForeignKeyConstraint(['machine_id'], ['machines.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    with op.batch_alter_table('machine_search_grams', schema=None) as batch_op:
+        batch_op.create_index('ix_machine_search_grams_machine_id', ['machine_id'], unique=False)
+        batch_op.create_index(
+            'ix_machine_search_grams_field_gram_machine_id',
+            ['field', 'gram', 'machine_id'],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('machine_search_grams', schema=None) as batch_op:
+        batch_op.drop_index('ix_machine_search_grams_field_gram_machine_id')
+        batch_op.drop_index('ix_machine_search_grams_machine_id')
+
+    op.drop_table('machine_search_grams')
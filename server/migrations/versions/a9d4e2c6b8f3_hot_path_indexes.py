@@ -0,0 +1,76 @@
+"""index pack for hot read, export and delete query paths
+
+Check plans against a seeded database afterwards with:
+    python benchmarks/check_query_plans.py
+
+Revision ID: a9d4e2c6b8f3
+Revises: f2b7c5d8e3a1
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9d4e2c6b8f3'
+down_revision = 'f2b7c5d8e3a1'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = {
+    'work_orders': [
+        # machine history, refresh_latest_work_order (max id per machine), FK joins
+        ('ix_work_orders_machine_id_id', ['machine_id', 'id']),
+        # machines list ?user_id filter
+        ('ix_work_orders_initiated_by_initiated_on', ['initiated_by', 'initiated_on']),
+        # turnaround analytics date range
+        ('ix_work_orders_closed_on', ['closed_on']),
+    ],
+    'work_order_events': [
+        # user metrics counts/page and export report; event_type makes the counts covering
+        ('ix_work_order_events_technician_id_event_date', ['technician_id', 'event_date', 'event_type']),
+        # machine history timeline
+        ('ix_work_order_events_machine_id_event_date', ['machine_id', 'event_date']),
+        # work order delete cascade
+        ('ix_work_order_events_work_order_id', ['work_order_id']),
+        # turnaround reopen counts
+        ('ix_work_order_events_event_type_work_order_id', ['event_type', 'work_order_id']),
+    ],
+    'machine_notes': [
+        # machine detail, history and delete
+        ('ix_machine_notes_machine_id_added_on', ['machine_id', 'added_on']),
+    ],
+}
+
+# MySQL drops its implicit foreign key index once one of the indexes above can
+# back the constraint, and then refuses to drop that index. Downgrade recreates a
+# plain index on each of these columns first.
+FOREIGN_KEY_COLUMNS = {
+    'work_orders': ['machine_id', 'initiated_by'],
+    'work_order_events': ['technician_id', 'machine_id'],
+    'machine_notes': ['machine_id'],
+}
+
+
+def upgrade():
+    for table, indexes in INDEXES.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for name, columns in indexes:
+                batch_op.create_index(name, columns, unique=False)
+
+
+def downgrade():
+    for table, columns in FOREIGN_KEY_COLUMNS.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.create_index(f'ix_{table}_{column}', [column], unique=False)
+
+    for table, indexes in INDEXES.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for name, _ in reversed(indexes):
+                # The single-column work_order_id index now backs its FK on MySQL; keep it there.
+                if name == 'ix_work_order_events_work_order_id' and op.get_bind().dialect.name == 'mysql':
+                    continue
+                batch_op.drop_index(name)
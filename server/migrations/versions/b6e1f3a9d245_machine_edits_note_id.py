@@ -0,0 +1,26 @@
+"""add note_id to machine_edits for note deletes in the change feed
+
+Revision ID: b6e1f3a9d245
+Revises: a9d4e2c6b8f3
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6e1f3a9d245'
+down_revision = 'a9d4e2c6b8f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('machine_edits', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('note_id', sa.Integer(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('machine_edits', schema=None) as batch_op:
+        batch_op.drop_column('note_id')
@@ -0,0 +1,48 @@
+"""add machine_note_tokens inverted index for note search
+
+Populate existing notes afterwards with:
+    python rebuild_derived_data.py --only note_tokens
+
+Revision ID: c47d1e9f0a52
+Revises: 8b2e4f6a1c37
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c47d1e9f0a52'
+down_revision = '8b2e4f6a1c37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'machine_note_tokens',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('note_id', sa.Integer(), nullable=False),
+        sa.Column('machine_id', sa.Integer(), nullable=False),
+        sa.Column('token', sa.String(length=64), nullable=False),
+        sa.Column('frequency', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['machine_id'], ['machines.id']),
+        sa.ForeignKeyConstraint(['note_id'], ['machine_notes.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    with op.batch_alter_table('machine_note_tokens', schema=None) as batch_op:
+        batch_op.create_index('ix_machine_note_tokens_note_id', ['note_id'], unique=False)
+        batch_op.create_index(
+            'ix_machine_note_tokens_token_machine_id',
+            ['token', 'machine_id', 'frequency'],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('machine_note_tokens', schema=None) as batch_op:
+        batch_op.drop_index('ix_machine_note_tokens_token_machine_id')
+        batch_op.drop_index('ix_machine_note_tokens_note_id')
+
+    op.drop_table('machine_note_tokens')
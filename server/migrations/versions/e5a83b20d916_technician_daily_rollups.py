@@ -0,0 +1,50 @@
+"""add technician_daily_rollups for event totals per technician and day
+
+Populate history afterwards with:
+    python rebuild_derived_data.py --only technician_rollups
+
+Revision ID: e5a83b20d916
+Revises: c47d1e9f0a52
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a83b20d916'
+down_revision = 'c47d1e9f0a52'
+branch_labels = None
+depends_on = None
+
+
+EVENT_VALUES = ("initiated", "completed", "trashed", "reopened", "archived", "unarchived")
+REASON_VALUES = ("default", "warranty", "return")
+CATEGORY_VALUES = (
+    "refrigerator", "freezer", "washer", "dryer", "range",
+    "oven", "microwave", "water_heater", "laundry_tower", "dishwasher",
+)
+
+
+def upgrade():
+    op.create_table(
+        'technician_daily_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('technician_id', sa.Integer(), nullable=False),
+        sa.Column('event_date', sa.Date(), nullable=False),
+        sa.Column('event_type', sa.Enum(*EVENT_VALUES, name='event_enum', native_enum=False, length=10), nullable=False),
+        sa.Column('reason', sa.Enum(*REASON_VALUES, name='event_reason_enum', native_enum=False, length=8), nullable=False),
+        sa.Column('category', sa.Enum(*CATEGORY_VALUES, name='type_enum', native_enum=False, length=13), nullable=False),
+        sa.Column('event_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['technician_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'technician_id', 'event_date', 'event_type', 'reason', 'category',
+            name='uq_technician_daily_rollups_key',
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table('technician_daily_rollups')
@@ -0,0 +1,39 @@
+"""add machine_edits append-only log for the change feed
+
+Revision ID: f2b7c5d8e3a1
+Revises: e5a83b20d916
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b7c5d8e3a1'
+down_revision = 'e5a83b20d916'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'machine_edits',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('machine_id', sa.Integer(), nullable=False),
+        sa.Column('work_order_id', sa.Integer(), nullable=True),
+        sa.Column('action', sa.String(length=20), nullable=False),
+        sa.Column('edited_by', sa.Integer(), nullable=False),
+        sa.Column('edited_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['edited_by'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    with op.batch_alter_table('machine_edits', schema=None) as batch_op:
+        batch_op.create_index('ix_machine_edits_machine_id', ['machine_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('machine_edits', schema=None) as batch_op:
+        batch_op.drop_index('ix_machine_edits_machine_id')
+
+    op.drop_table('machine_edits')
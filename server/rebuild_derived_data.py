@@ -0,0 +1,171 @@
+import argparse
+import json
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import MetaData, Table, create_engine, delete, func, insert, select, update
+
+from app.models.machine_note_tokens import tokenize
+from app.models.machine_search_grams import SEARCH_FIELDS, grams_for_value
+
+
+BATCH_SIZE = 5000
+
+
+def _load_tables(engine, names):
+    metadata = MetaData()
+    return {name: Table(name, metadata, autoload_with=engine) for name in names}
+
+
+def backfill_latest_work_orders(conn, tables):
+    machines = tables["machines"]
+    work_orders = tables["work_orders"]
+
+    latest_id = (
+        select(func.max(work_orders.c.id))
+        .where(work_orders.c.machine_id == machines.c.id)
+        .scalar_subquery()
+    )
+    conn.execute(update(machines).values(latest_work_order_id=latest_id))
+
+    latest_status = (
+        select(work_orders.c.current_status)
+        .where(work_orders.c.id == machines.c.latest_work_order_id)
+        .scalar_subquery()
+    )
+    conn.execute(update(machines).values(current_status=latest_status))
+
+    return {
+        "machines_with_work_orders": conn.execute(
+            select(func.count()).select_from(machines).where(machines.c.latest_work_order_id.is_not(None))
+        ).scalar_one()
+    }
+
+
+def rebuild_search_grams(conn, tables):
+    machines = tables["machines"]
+    grams_table = tables["machine_search_grams"]
+
+    conn.execute(delete(grams_table))
+
+    total = 0
+    rows = []
+    result = conn.execute(select(machines.c.id, machines.c.serial, machines.c.model).order_by(machines.c.id))
+    for machine in result.mappings():
+        for field in SEARCH_FIELDS:
+            for gram in grams_for_value(machine[field]):
+                rows.append({"machine_id": machine["id"], "field": field, "gram": gram})
+        if len(rows) >= BATCH_SIZE:
+            conn.execute(insert(grams_table), rows)
+            total += len(rows)
+            rows = []
+    if rows:
+        conn.execute(insert(grams_table), rows)
+        total += len(rows)
+
+    return {"grams": total}
+
+
+def rebuild_note_tokens(conn, tables):
+    notes = tables["machine_notes"]
+    tokens_table = tables["machine_note_tokens"]
+
+    conn.execute(delete(tokens_table))
+
+    total = 0
+    rows = []
+    result = conn.execute(select(notes.c.id, notes.c.machine_id, notes.c.content).order_by(notes.c.id))
+    for note in result.mappings():
+        for token, frequency in tokenize(note["content"]).items():
+            rows.append({"note_id": note["id"], "machine_id": note["machine_id"], "token": token, "frequency": frequency})
+        if len(rows) >= BATCH_SIZE:
+            conn.execute(insert(tokens_table), rows)
+            total += len(rows)
+            rows = []
+    if rows:
+        conn.execute(insert(tokens_table), rows)
+        total += len(rows)
+
+    return {"tokens": total}
+
+
+def rebuild_technician_rollups(conn, tables):
+    events = tables["work_order_events"]
+    machines = tables["machines"]
+    rollups = tables["technician_daily_rollups"]
+
+    conn.execute(delete(rollups))
+
+    reason = func.coalesce(events.c.reason, "default")
+    grouped = (
+        select(
+            events.c.technician_id,
+            events.c.event_date,
+            events.c.event_type,
+            reason,
+            machines.c.category,
+            func.count(events.c.id),
+        )
+        .select_from(events.join(machines, machines.c.id == events.c.machine_id))
+        .group_by(events.c.technician_id, events.c.event_date, events.c.event_type, reason, machines.c.category)
+    )
+    conn.execute(
+        insert(rollups).from_select(
+            ["technician_id", "event_date", "event_type", "reason", "category", "event_count"],
+            grouped,
+        )
+    )
+
+    return {"rollup_rows": conn.execute(select(func.count()).select_from(rollups)).scalar_one()}
+
+
+STEPS = {
+    "latest_work_orders": (["machines", "work_orders"], backfill_latest_work_orders),
+    "search_grams": (["machines", "machine_search_grams"], rebuild_search_grams),
+    "note_tokens": (["machine_notes", "machine_note_tokens"], rebuild_note_tokens),
+    "technician_rollups": (["work_order_events", "machines", "technician_daily_rollups"], rebuild_technician_rollups),
+}
+
+
+def rebuild_derived_data(database_uri: str, only: list[str] | None = None):
+    engine = create_engine(database_uri)
+    selected = only or list(STEPS)
+    summary = {}
+
+    for name in selected:
+        table_names, step = STEPS[name]
+        tables = _load_tables(engine, table_names)
+        with engine.begin() as conn:
+            summary[name] = step(conn, tables)
+
+    return summary
+
+
+def main():
+    load_dotenv(Path(__file__).resolve().parent / ".env")
+    parser = argparse.ArgumentParser(
+        description="Backfill/repair denormalized and index tables (latest work order pointers, search grams, note tokens, technician rollups) from source tables."
+    )
+    parser.add_argument(
+        "--database-uri",
+        default=os.getenv("DATABASE_URI"),
+        help="Target SQLAlchemy DB URI. Defaults to DATABASE_URI env var.",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=list(STEPS),
+        help="Rebuild only the named step. Repeatable. Defaults to every step.",
+    )
+    args = parser.parse_args()
+
+    if not args.database_uri:
+        raise SystemExit("Missing database URI. Pass --database-uri or set DATABASE_URI in environment/.env.")
+
+    summary = rebuild_derived_data(args.database_uri, only=args.only)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
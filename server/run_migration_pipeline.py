@@ -12,6 +12,7 @@ from sqlalchemy import create_engine, text
 
 from format_legacy_data import format_legacy_data
 from load_migration_payload import load_payload
+from rebuild_derived_data import rebuild_derived_data
 
 
 TARGET_TABLES = [
@@ -149,6 +150,7 @@ def run_pipeline(
             clear_first=True,
         )
         summary["steps"]["load"] = load_summary
+        summary["steps"]["rebuild_derived"] = rebuild_derived_data(new_database_uri)
         summary["steps"]["verify_counts"] = _table_counts(new_database_uri)
     else:
         summary["steps"]["load"] = {"status": "skipped", "reason": "Use --execute-load to perform real inserts."}
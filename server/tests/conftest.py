@@ -0,0 +1,72 @@
+import pytest
+from cachelib import SimpleCache
+from sqlalchemy.pool import StaticPool
+
+from config import Config
+from app import create_app
+from app.extensions import bcrypt, db
+from app.models import Base, RoleEnum, User
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+    SQLALCHEMY_ENGINE_OPTIONS = {"connect_args": {"check_same_thread": False}, "poolclass": StaticPool}
+    SESSION_TYPE = "cachelib"
+    SESSION_CACHELIB = SimpleCache()
+    CACHE_ENABLED = False
+    PUBSUB_BACKEND = "local"
+    PROMETHEUS_ENABLED = False
+    QUERY_STATS_HEADERS = True
+    CHANGE_FEED_COMMIT_LAG_SECONDS = 0
+    MAIL_SUPPRESS_SEND = True
+
+
+@pytest.fixture
+def app():
+    app = create_app(TestConfig)
+    with app.app_context():
+        Base.metadata.create_all(db.engine)
+        db.session.add(User(
+            first_name="Test",
+            last_name="Admin",
+            email="admin@example.com",
+            role=RoleEnum.ADMIN,
+            password_hash=bcrypt.generate_password_hash("password").decode(),
+        ))
+        db.session.commit()
+    # Requests must not share an outer app context (flask_login caches the user on g),
+    # so tests open their own app_context() for direct database work.
+    yield app
+    with app.app_context():
+        db.session.remove()
+        Base.metadata.drop_all(db.engine)
+
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    response = client.post("/api/auth/login", json={"email": "admin@example.com", "password": "password"})
+    assert response.status_code == 200, response.json
+    return client
+
+
+@pytest.fixture
+def add_machine(client):
+    def add_machine(serial, **fields):
+        payload = {
+            "serial": serial,
+            "brand": "lg",
+            "model": "WM3400",
+            "form_factor": "front load",
+            "color": "white",
+            "category": "washer",
+            "condition": "used",
+            "vendor": "unknown",
+            "note_content": "intake",
+            **fields,
+        }
+        response = client.post("/api/create/machine", json=payload)
+        assert response.status_code == 201, response.json
+        return response.json["machine_id"]
+    return add_machine
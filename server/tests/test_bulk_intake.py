@@ -0,0 +1,71 @@
+from sqlalchemy import func, select
+
+from app.extensions import db
+from app.models import Machine
+
+
+def _machine(serial, **fields):
+    return {
+        "serial": serial,
+        "brand": "lg",
+        "model": "WM3400",
+        "form_factor": "front load",
+        "color": "white",
+        "category": "washer",
+        "condition": "used",
+        "vendor": "unknown",
+        **fields,
+    }
+
+
+def test_bulk_intake_reports_non_text_fields_per_item(client):
+    response = client.post("/api/create/machines", json={"machines": [
+        _machine("BULKOK1"),
+        _machine("BULKBAD1", model=123),
+        _machine(555),
+    ]})
+
+    assert response.status_code == 400
+    assert response.json["errors"] == [
+        {"index": 1, "serial": "BULKBAD1", "message": "Fields must be text: model"},
+        {"index": 2, "serial": None, "message": "Fields must be text: serial"},
+    ]
+
+
+def test_bulk_intake_requires_login(app):
+    response = app.test_client().post("/api/create/machines", json={"machines": [_machine("BULKANON1")]})
+
+    assert response.status_code == 401
+    with app.app_context():
+        assert db.session.scalar(select(func.count(Machine.id))) == 0
+
+
+def test_bulk_intake_matches_single_intake(client, app, add_machine):
+    single_id = add_machine("SINGLE1", model="DV5000", category="dryer", note_content="drum bearing squeals")
+    response = client.post("/api/create/machines", json={"machines": [
+        _machine("BULK1", model="DV5000", category="dryer", note_content="drum bearing squeals"),
+        _machine("BULK2", note_content="door seal torn"),
+    ]})
+    assert response.status_code == 201, response.json
+    bulk_id, other_id = [m["machine_id"] for m in response.json["machines"]]
+
+    with app.app_context():
+        machines = {m.id: m for m in db.session.scalars(select(Machine))}
+        for machine_id in (single_id, bulk_id, other_id):
+            machine = machines[machine_id]
+            assert machine.latest_work_order is not None
+            assert machine.latest_work_order.machine_id == machine_id
+            assert machine.current_status == machines[single_id].current_status
+
+    found = {m["id"] for m in client.get("/api/read/machines/search?q=DV50").json["machines"]}
+    assert {single_id, bulk_id} <= found
+    assert other_id not in found
+
+    hits = {r["machine_id"]: r for r in client.get("/api/read/notes/search?q=bearing").json["results"]}
+    assert set(hits) == {single_id, bulk_id}
+    assert hits[bulk_id]["score"] == hits[single_id]["score"]
+
+    rolled = client.get("/api/read/metrics/1?counts_only=1").json["metrics"]["counts"]
+    raw = client.get("/api/read/metrics/1").json["metrics"]["counts"]
+    assert rolled == raw
+    assert raw["initiated"] == 3
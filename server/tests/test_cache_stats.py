@@ -0,0 +1,19 @@
+from app.extensions import bcrypt, db
+from app.models import RoleEnum, User
+
+
+def test_cache_stats_requires_admin(app, client):
+    with app.app_context():
+        db.session.add(User(
+            first_name="Test",
+            last_name="Tech",
+            email="tech@example.com",
+            role=RoleEnum.TECHNICIAN,
+            password_hash=bcrypt.generate_password_hash("password").decode(),
+        ))
+        db.session.commit()
+    technician = app.test_client()
+    assert technician.post("/api/auth/login", json={"email": "tech@example.com", "password": "password"}).status_code == 200
+
+    assert technician.get("/api/read/cache/stats").status_code == 403
+    assert client.get("/api/read/cache/stats").status_code == 200
@@ -0,0 +1,61 @@
+import base64
+
+from app.extensions import db
+from app.models import MachineNote
+
+
+def test_change_feed_reports_deleted_notes(client, add_machine):
+    machine_id = add_machine("FEED1")
+    note_id = client.get(f"/api/read/machine/{machine_id}").json["machine"]["notes"][0]["id"]
+    token = client.get("/api/read/changes").json["token"]
+
+    assert client.delete(f"/api/delete/note/{note_id}").status_code == 200
+
+    # The first poll after the change only raises the ceiling past it.
+    first = client.get(f"/api/read/changes?since={token}").json
+    second = client.get(f"/api/read/changes?since={first['token']}").json
+    assert first["deleted_note_ids"] + second["deleted_note_ids"] == [note_id]
+    assert first["notes"] + second["notes"] == []
+
+
+def test_change_feed_does_not_skip_rows_that_commit_late(app, client, add_machine):
+    machine_id = add_machine("FEED2")
+    token = client.get("/api/read/changes").json["token"]
+
+    def add_note(note_id):
+        with app.app_context():
+            note = MachineNote(id=note_id, content=f"note {note_id}", technician_id=1, machine_id=machine_id)
+            db.session.add(note)
+            note.reindex_tokens()
+            db.session.commit()
+
+    # Ids are handed out at insert: note 3 belongs to a transaction that is
+    # still open while note 4 has already committed.
+    add_note(2)
+    add_note(4)
+    first = client.get(f"/api/read/changes?since={token}").json
+    add_note(3)
+    second = client.get(f"/api/read/changes?since={first['token']}").json
+
+    seen = [note["id"] for note in first["notes"] + second["notes"]]
+    assert sorted(seen) == [2, 3, 4]
+
+
+def test_change_feed_waits_out_the_commit_lag(app, client, add_machine):
+    app.config["CHANGE_FEED_COMMIT_LAG_SECONDS"] = 60
+    token = client.get("/api/read/changes").json["token"]
+    add_machine("FEED3")
+
+    feed = client.get(f"/api/read/changes?since={token}").json
+    assert feed["events"] == []
+
+    app.config["CHANGE_FEED_COMMIT_LAG_SECONDS"] = 0
+    feed = client.get(f"/api/read/changes?since={feed['token']}").json
+    feed = client.get(f"/api/read/changes?since={feed['token']}").json
+    assert [event["event_type"] for event in feed["events"]] == ["initiated"]
+
+
+def test_change_feed_rejects_malformed_tokens(client):
+    three_part = base64.urlsafe_b64encode(b"1:2:3").decode("ascii").rstrip("=")
+    assert client.get(f"/api/read/changes?since={three_part}").status_code == 400
+    assert client.get("/api/read/changes?since=not-a-token").status_code == 400
@@ -0,0 +1,18 @@
+from datetime import date
+
+from app.instrumentation import query_budget
+
+
+def test_csv_user_report_skips_rollup_summary(client, add_machine):
+    add_machine("EXPORT1")
+    today = date.today().isoformat()
+
+    with query_budget() as stats:
+        response = client.get(f"/api/export/user_report/1?start={today}&end={today}&format=csv")
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert not [stmt for stmt in stats.fingerprints if "technician_daily_rollups" in stmt]
+
+    summary = client.get(f"/api/export/user_report/1?start={today}&end={today}&format=summary")
+    assert summary.json["summary"]["counts"]["initiated"] == 1
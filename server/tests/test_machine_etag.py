@@ -0,0 +1,13 @@
+def test_machine_etag_works_without_cache(client, add_machine):
+    machine_id = add_machine("ETAG1")
+
+    first = client.get(f"/api/read/machine/{machine_id}")
+    etag = first.headers.get("ETag")
+    assert etag
+
+    assert client.get(f"/api/read/machine/{machine_id}", headers={"If-None-Match": etag}).status_code == 304
+
+    assert client.patch(f"/api/update/machine/{machine_id}", json={"color": "black"}).status_code == 200
+    changed = client.get(f"/api/read/machine/{machine_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json["machine"]["color"] == "black"
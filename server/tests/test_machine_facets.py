@@ -0,0 +1,31 @@
+from app.extensions import db
+from app.models import Machine
+from app.models.enums import CategoryEnum, ConditionEnum, VendorEnum
+
+
+def test_facets_count_machines_without_a_work_order(app, client, add_machine):
+    add_machine("WO100")
+    # Legacy/imported rows can exist without any work order.
+    with app.app_context():
+        db.session.add(Machine(
+            brand="ge",
+            model="GTD45",
+            serial="NOWO1",
+            category=CategoryEnum.DRYER,
+            form_factor="top load",
+            color="white",
+            condition=ConditionEnum.USED,
+            vendor=VendorEnum.UNKNOWN,
+        ))
+        db.session.commit()
+
+    response = client.get("/api/read/machines/facets")
+
+    assert response.status_code == 200, response.json
+    facets = response.json["facets"]
+    assert facets["status"] == {"in_progress": 1, "none": 1}
+    assert facets["technician"]["none"] == 1
+    assert facets["category"] == {"washer": 1, "dryer": 1}
+    assert {"status": "none", "technician": "none"}.items() <= next(
+        c for c in facets["combinations"] if c["category"] == "dryer"
+    ).items()
@@ -0,0 +1,39 @@
+from app.instrumentation import query_budget
+
+
+def _history(client, machine_id, **params):
+    with query_budget() as stats:
+        response = client.get(f"/api/read/machine/{machine_id}/history", query_string=params)
+    assert response.status_code == 200, response.json
+    return response.json, stats.count
+
+
+def test_machine_history_pages_in_timeline_order(client, add_machine):
+    machine_id = add_machine("HIST1")
+    for i in range(3):
+        assert client.post(f"/api/create/note/{machine_id}", json={"content": f"follow up {i}"}).status_code == 201
+
+    pages = [_history(client, machine_id, page=page, per_page=2)[0] for page in (1, 2, 3)]
+
+    assert pages[0]["total_items"] == 6
+    assert pages[0]["total_pages"] == 3
+    timeline = [entry for page in pages for entry in page["timeline"]]
+    assert [entry["type"] for entry in timeline] == ["work_order", "event", "note", "note", "note", "note"]
+    assert [entry["note"]["content"] for entry in timeline[3:]] == ["follow up 0", "follow up 1", "follow up 2"]
+
+
+def test_machine_history_page_cost_does_not_grow_with_history(client, add_machine):
+    short = add_machine("HIST2")
+    long = add_machine("HIST3")
+    for i in range(30):
+        assert client.post(f"/api/create/note/{long}", json={"content": f"note {i}"}).status_code == 201
+
+    # Same page shape (work order, event, notes) on both machines.
+    _, short_count = _history(client, short, per_page=5)
+    _, long_count = _history(client, long, per_page=5)
+    assert long_count == short_count
+
+    # A deep page only hydrates the kinds it contains.
+    body, deep_count = _history(client, long, page=4, per_page=5)
+    assert [entry["note"]["content"] for entry in body["timeline"]] == [f"note {i}" for i in range(12, 17)]
+    assert deep_count <= short_count
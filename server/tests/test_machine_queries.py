@@ -0,0 +1,38 @@
+from app.extensions import db
+from app.instrumentation import query_budget
+from app.models import MachineNote, RoleEnum, User
+
+
+def _detail_query_count(client, machine_id):
+    with query_budget(max_repeats=1) as stats:
+        response = client.get(f"/api/read/machine/{machine_id}")
+    assert response.status_code == 200, response.json
+    return stats.count, response.json["machine"]
+
+
+def test_machine_detail_query_count_does_not_grow_with_notes(app, client, add_machine):
+    one_note = add_machine("NOTES1")
+    many_notes = add_machine("NOTES25")
+    # Distinct authors, so a lazy technician load per note would show up.
+    with app.app_context():
+        for i in range(24):
+            technician = User(
+                first_name=f"Tech{i}",
+                last_name="Notes",
+                email=f"tech{i}@example.com",
+                role=RoleEnum.TECHNICIAN,
+                password_hash="unused",
+            )
+            db.session.add(technician)
+            db.session.flush()
+            note = MachineNote(content=f"follow up {i}", technician_id=technician.id, machine_id=many_notes)
+            db.session.add(note)
+            note.reindex_tokens()
+        db.session.commit()
+
+    one_count, one_payload = _detail_query_count(client, one_note)
+    many_count, many_payload = _detail_query_count(client, many_notes)
+
+    assert len(one_payload["notes"]) == 1
+    assert len(many_payload["notes"]) == 25
+    assert many_count == one_count
@@ -0,0 +1,11 @@
+from benchmarks.check_query_plans import check_query_plans
+from benchmarks.load_test import seed_load_test
+
+
+def test_hot_queries_use_indexes(tmp_path):
+    uri = f"sqlite:///{tmp_path / 'plans.db'}"
+    seed_load_test(uri, machine_count=300, user_count=4)
+
+    result = check_query_plans(uri)
+
+    assert result["failures"] == [], {name: result["queries"][name]["plan"] for name in result["failures"]}
@@ -0,0 +1,27 @@
+def test_user_metrics_returns_every_event_unless_paged(client, add_machine):
+    for i in range(3):
+        add_machine(f"METRIC{i}")
+
+    full = client.get("/api/read/metrics/1").json["metrics"]
+    assert len(full["events"]) == 3
+    assert "total_pages" not in full
+
+    paged = client.get("/api/read/metrics/1?per_page=2&page=2").json["metrics"]
+    assert len(paged["events"]) == 1
+    assert paged["total_pages"] == 2
+
+
+def test_rollup_counts_follow_a_category_edit(app, client, add_machine):
+    machine_id = add_machine("RECAT1", category="washer")
+    assert client.patch(f"/api/update/machine/{machine_id}", json={"category": "dryer"}).status_code == 200
+
+    rolled = client.get("/api/read/metrics/1?counts_only=1").json["metrics"]["counts"]
+    assert rolled["initiated"] == 1
+
+    work_order_id = client.get(f"/api/read/machine/{machine_id}").json["machine"]["latest_work_order"]["id"]
+    assert client.delete(f"/api/delete/work_order/{work_order_id}").status_code == 200
+
+    rolled = client.get("/api/read/metrics/1?counts_only=1").json["metrics"]["counts"]
+    raw = client.get("/api/read/metrics/1").json["metrics"]["counts"]
+    assert rolled == raw
+    assert rolled["initiated"] == 0